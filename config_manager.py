@@ -1,17 +1,23 @@
 import json
 import os
+import re
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Set, Tuple
 
 
 class ConfigurationError(Exception):
     pass
 
 
+_PLACEHOLDER_RE = re.compile(r"\{([^}]+)\}")
+
+
 class ConfigManager:
     def __init__(self, config_dir: str = "config"):
         self.config_dir = Path(config_dir)
         self._ensure_config_dir()
+        # Parsed JSON keyed by path, reused while (mtime_ns, size) is unchanged
+        self._parsed_configs: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
 
     def _ensure_config_dir(self) -> None:
         if not self.config_dir.exists():
@@ -23,18 +29,26 @@ class ConfigManager:
         """Load and validate configuration from JSON file."""
         config_path = self.config_dir / config_file
 
-        if not config_path.exists():
-            raise ConfigurationError(f"Configuration file {config_path} does not exist")
-
         try:
-            with open(config_path, "r") as f:
-                config_data = json.load(f)
-        except json.JSONDecodeError as e:
-            raise ConfigurationError(f"Invalid JSON in {config_path}: {e}")
-        except Exception as e:
-            raise ConfigurationError(f"Failed to read {config_path}: {e}")
+            stat = config_path.stat()
+        except FileNotFoundError:
+            raise ConfigurationError(f"Configuration file {config_path} does not exist")
 
-        # Substitute environment variables
+        file_version = (stat.st_mtime_ns, stat.st_size)
+        cached = self._parsed_configs.get(str(config_path))
+        if cached and cached[0] == file_version:
+            config_data = cached[1]
+        else:
+            try:
+                with open(config_path, "r") as f:
+                    config_data = json.load(f)
+            except json.JSONDecodeError as e:
+                raise ConfigurationError(f"Invalid JSON in {config_path}: {e}")
+            except Exception as e:
+                raise ConfigurationError(f"Failed to read {config_path}: {e}")
+            self._parsed_configs[str(config_path)] = (file_version, config_data)
+
+        # Substitute environment variables (builds a fresh copy of config_data)
         config_data = self._substitute_env_vars(config_data)
 
         # Simple validation
@@ -233,3 +247,52 @@ class ConfigManager:
                 raise ConfigurationError(
                     f"Join {i}: 'on' clause must contain 'left_key' and 'right_key'"
                 )
+
+    def get_referenced_columns(self, config: Dict[str, Any]) -> Set[str]:
+        """Collect the CSV columns used by filters, joins and schema_mapping."""
+        columns = set(config.get("filters") or {})
+
+        for join_config in config["join_strategy"].get("joins", []):
+            for side in ("left_key", "right_key"):
+                key = join_config["on"][side]
+                columns.update(key if isinstance(key, list) else [key])
+
+        def add_field(field_config):
+            if isinstance(field_config, str):
+                columns.add(field_config)
+            elif isinstance(field_config, dict):
+                if field_config.get("hasura_col"):
+                    columns.add(field_config["hasura_col"])
+                synthetic_value = field_config.get("synthetic_value")
+                if isinstance(synthetic_value, str):
+                    columns.update(_PLACEHOLDER_RE.findall(synthetic_value))
+
+        schema_mapping = config.get("schema_mapping", {})
+        for node_config in schema_mapping.get("nodes", {}).values():
+            add_field(node_config.get("id_field"))
+            for prop_config in node_config.get("properties", {}).values():
+                add_field(prop_config)
+
+        for rel_config in schema_mapping.get("relationships", {}).values():
+            for side in ("start_csv_field", "end_csv_field"):
+                if rel_config.get(side):
+                    columns.add(rel_config[side])
+            for prop_config in rel_config.get("properties", {}).values():
+                add_field(prop_config)
+
+        return columns
+
+    def prune_materialized_views(self, config: Dict[str, Any]) -> Dict[str, List[str]]:
+        """Drop MV fields whose output column is never used downstream."""
+        referenced = self.get_referenced_columns(config)
+        pruned_views = {}
+
+        for view_name, fields in config["materialized_views"].items():
+            # "alias: expr(...)" is returned under the alias
+            pruned_views[view_name] = [
+                field
+                for field in fields
+                if field.split(":", 1)[0].strip() in referenced
+            ]
+
+        return pruned_views
@@ -1,6 +1,6 @@
 import pandas as pd
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Set
 import logging
 
 
@@ -18,11 +18,13 @@ class DataCleaner:
         filters: Optional[dict] = None,
         schema_mapping: Optional[dict] = None,
         array_expansion: Optional[dict] = None,
+        keep_columns: Optional[Set[str]] = None,
     ):
         self.output_dir = Path(output_dir)
         self.filters = filters or {}
         self.schema_mapping = schema_mapping or {}
         self.array_expansion = array_expansion or {}
+        self.keep_columns = keep_columns
         self.logger = logging.getLogger(__name__)
 
     def clean_data(self, csv_file_path: str) -> str:
@@ -80,6 +82,14 @@ class DataCleaner:
         """
         df_cleaned = df.copy()
 
+        # Drop unused columns first so later passes touch fewer columns
+        if self.keep_columns is not None:
+            unused_columns = [
+                col for col in df_cleaned.columns if col not in self.keep_columns
+            ]
+            df_cleaned = df_cleaned.drop(columns=unused_columns)
+            self.logger.info(f"Dropped {len(unused_columns)} unused columns")
+
         # Remove empty rows
         df_cleaned = df_cleaned.dropna(how="all")
         self.logger.info(f"Removed empty rows, now have {len(df_cleaned)} rows")
@@ -66,12 +66,14 @@ def create_expanded_csv(input_file: str, json_column: str, output_dir: str):
 
     print(f"Processing {json_column} column...")
 
-    # Read entire CSV at once (all rows)
-    print(f"  Loading all rows from CSV...")
-    df = pd.read_csv(input_file, low_memory=False)
-    print(f"  Loaded {len(df)} rows")
+    header = pd.read_csv(input_file, nrows=0).columns
+
+    if json_column in header:
+        # Parse only the column being expanded, not the whole file
+        print(f"  Loading {json_column} column from CSV...")
+        df = pd.read_csv(input_file, usecols=[json_column], dtype=str)
+        print(f"  Loaded {len(df)} rows")
 
-    if json_column in df.columns:
         # Expand only this specific JSON column - return ONLY expanded columns
         print(f"  Expanding {json_column} column...")
         expanded_df = expand_json_column_only(df, json_column)
@@ -103,10 +105,11 @@ def main():
     try:
         output_files = []
 
+        # Read the header once to check which columns exist
+        header = pd.read_csv(input_file, nrows=0).columns
+
         for json_col in json_columns:
-            # Check if column exists in the first chunk
-            first_chunk = pd.read_csv(input_file, nrows=1)
-            if json_col in first_chunk.columns:
+            if json_col in header:
                 output_file = create_expanded_csv(input_file, json_col, output_dir)
                 output_files.append(output_file)
                 print()
@@ -2,8 +2,14 @@ import os
 import requests
 import pandas as pd
 import logging
+import threading
+from pandas.api.types import is_numeric_dtype
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+
+# Upper bound on materialized views fetched from Hasura at the same time
+MAX_VIEW_WORKERS = 8
 
 
 class HasuraExtractor:
@@ -12,8 +18,16 @@ class HasuraExtractor:
     and joins the data into a single consolidated CSV file.
     """
 
-    def __init__(self, endpoint: str = None, output_dir: str = "data"):
+    def __init__(
+        self,
+        endpoint: str = None,
+        output_dir: str = "data",
+        page_size: Optional[int] = None,
+        page_order_by: Optional[Dict[str, List[str]]] = None,
+    ):
         self.endpoint = endpoint or os.getenv("HASURA_ENDPOINT")
+        self.page_size = page_size
+        self.page_order_by = page_order_by or {}
         self.api_key = os.getenv("HASURA_API_KEY")
         self.auth_type = os.getenv("OAK_AUTH_TYPE")
         self.output_dir = Path(output_dir)
@@ -28,9 +42,29 @@ class HasuraExtractor:
         if not self.auth_type:
             raise ValueError("OAK_AUTH_TYPE environment variable required")
 
+        # requests.Session isn't thread-safe, so each thread (the caller's and
+        # every view worker) gets its own pooled session, reused for its queries
+        self._local = threading.local()
+
         # Ensure output directory exists
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+    @property
+    def session(self) -> requests.Session:
+        """The current thread's Hasura session, created on first use"""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(
+                {
+                    "Content-Type": "application/json",
+                    "x-oak-auth-key": self.api_key,
+                    "x-oak-auth-type": self.auth_type,
+                }
+            )
+            self._local.session = session
+        return session
+
     def extract_and_join(
         self,
         materialized_views: Dict[str, List[str]],
@@ -78,12 +112,11 @@ class HasuraExtractor:
         self.logger.info(f"Extracting data from single source: {primary_mv}")
 
         fields = materialized_views[primary_mv]
-        data = self._query_materialized_view(primary_mv, fields, test_limit)
+        consolidated_df = self._query_view_dataframe(primary_mv, fields, test_limit)
 
-        if not data:
+        if consolidated_df.empty:
             raise ValueError(f"No data retrieved from {primary_mv}")
 
-        consolidated_df = pd.DataFrame(data)
         consolidated_df["_source_view"] = primary_mv
 
         # Save to CSV
@@ -116,16 +149,18 @@ class HasuraExtractor:
             f"Extracting data with {len(joins)} joins, primary MV: {primary_mv}"
         )
 
-        # Extract primary dataset
-        primary_fields = materialized_views[primary_mv]
-        primary_data = self._query_materialized_view(
-            primary_mv, primary_fields, test_limit
+        # Fetch every view concurrently; the joins below still run in order
+        view_names = [primary_mv] + [join_config["mv"] for join_config in joins]
+        view_dfs = self._query_views_concurrently(
+            view_names, materialized_views, test_limit
         )
 
-        if not primary_data:
+        # Extract primary dataset
+        result_df = view_dfs[primary_mv].copy()
+
+        if result_df.empty:
             raise ValueError(f"No data retrieved from primary MV {primary_mv}")
 
-        result_df = pd.DataFrame(primary_data)
         result_df["_primary_source"] = primary_mv
         self.logger.info(f"Primary dataset: {len(result_df)} records from {primary_mv}")
 
@@ -173,14 +208,12 @@ class HasuraExtractor:
             )
 
             # Extract join dataset
-            join_fields = materialized_views[join_mv]
-            join_data = self._query_materialized_view(join_mv, join_fields, test_limit)
+            join_df = view_dfs[join_mv].copy()
 
-            if not join_data:
+            if join_df.empty:
                 self.logger.warning(f"No data from {join_mv}, skipping join")
                 continue
 
-            join_df = pd.DataFrame(join_data)
             join_df[f"_source_{join_mv}"] = join_mv
 
             # Clean unit_slug - strip unitvariant_id suffix
@@ -227,6 +260,11 @@ class HasuraExtractor:
                 "outer": "outer",
             }
 
+            # Hash-join on shared categorical codes instead of raw strings
+            result_df, join_df = self._align_join_keys(
+                result_df, join_df, left_keys, right_keys
+            )
+
             # Use 'on' parameter when keys are identical, otherwise use left_on/right_on
             if left_keys == right_keys:
                 result_df = result_df.merge(
@@ -257,6 +295,29 @@ class HasuraExtractor:
 
         return str(csv_path)
 
+    def _align_join_keys(
+        self,
+        left_df: pd.DataFrame,
+        right_df: pd.DataFrame,
+        left_keys: List[str],
+        right_keys: List[str],
+    ) -> Tuple[pd.DataFrame, pd.DataFrame]:
+        """Cast string join keys on both sides to one shared categorical dtype."""
+        for left_key, right_key in zip(left_keys, right_keys):
+            left_col = left_df[left_key]
+            right_col = right_df[right_key]
+            if is_numeric_dtype(left_col) or is_numeric_dtype(right_col):
+                continue
+
+            categories = pd.Index(
+                pd.concat([left_col.dropna(), right_col.dropna()]).unique()
+            )
+            key_dtype = pd.CategoricalDtype(categories)
+            left_df[left_key] = left_col.astype(key_dtype)
+            right_df[right_key] = right_col.astype(key_dtype)
+
+        return left_df, right_df
+
     def _introspect_schema_fields(self, view_name: str) -> List[str]:
         """
         Use GraphQL introspection to discover available fields
@@ -301,16 +362,10 @@ class HasuraExtractor:
         }
         """
 
-        headers = {
-            "Content-Type": "application/json",
-            "x-oak-auth-key": self.api_key,
-            "x-oak-auth-type": self.auth_type,
-        }
-
         payload = {"query": introspection_query}
 
         try:
-            response = requests.post(self.endpoint, json=payload, headers=headers)
+            response = self.session.post(self.endpoint, json=payload)
             response.raise_for_status()
 
             result = response.json()
@@ -369,25 +424,80 @@ class HasuraExtractor:
             self.logger.warning(f"Schema introspection failed: {e}")
             return []
 
-    def _query_materialized_view(
+    def _query_views_concurrently(
+        self,
+        view_names: List[str],
+        materialized_views: Dict[str, List[str]],
+        limit: Optional[int] = None,
+    ) -> Dict[str, pd.DataFrame]:
+        """Query each distinct view on its own worker thread."""
+        unique_views = list(dict.fromkeys(view_names))
+        max_workers = min(MAX_VIEW_WORKERS, len(unique_views))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                view_name: executor.submit(
+                    self._query_view_dataframe,
+                    view_name,
+                    materialized_views[view_name],
+                    limit,
+                )
+                for view_name in unique_views
+            }
+            return {view_name: future.result() for view_name, future in futures.items()}
+
+    def _query_view_dataframe(
         self, view_name: str, fields: List[str], limit: Optional[int] = None
+    ) -> pd.DataFrame:
+        """
+        Query a materialized view into a DataFrame, one page at a time when
+        page_size and an order_by for the view are configured.
+        """
+        order_by = self.page_order_by.get(view_name)
+        if not self.page_size or not order_by:
+            return pd.DataFrame(self._query_materialized_view(view_name, fields, limit))
+
+        pages = []
+        offset = 0
+        while limit is None or offset < limit:
+            page_limit = self.page_size
+            if limit is not None:
+                page_limit = min(page_limit, limit - offset)
+
+            page = self._query_materialized_view(
+                view_name, fields, page_limit, offset=offset, order_by=order_by
+            )
+            if page:
+                pages.append(pd.DataFrame(page))
+
+            offset += len(page)
+            if len(page) < page_limit:
+                break
+
+        self.logger.info(f"Fetched {offset} records from {view_name} in pages")
+
+        if not pages:
+            return pd.DataFrame()
+        return pd.concat(pages, ignore_index=True)
+
+    def _query_materialized_view(
+        self,
+        view_name: str,
+        fields: List[str],
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        order_by: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
         """Query a single materialized view with specified fields."""
         self.logger.info(f"Querying {view_name} with {len(fields)} configured fields")
 
         # Build query with the provided fields
-        query = self._build_graphql_query(view_name, fields, limit)
-
-        headers = {
-            "Content-Type": "application/json",
-            "x-oak-auth-key": self.api_key,
-            "x-oak-auth-type": self.auth_type,
-        }
+        query = self._build_graphql_query(view_name, fields, limit, offset, order_by)
 
         payload = {"query": query}
 
         try:
-            response = requests.post(self.endpoint, json=payload, headers=headers)
+            response = self.session.post(self.endpoint, json=payload)
             response.raise_for_status()
 
             response_data = response.json()
@@ -430,16 +540,8 @@ class HasuraExtractor:
         }}
         """
 
-        headers = {
-            "Content-Type": "application/json",
-            "x-oak-auth-key": self.api_key,
-            "x-oak-auth-type": self.auth_type,
-        }
-
         try:
-            response = requests.post(
-                self.endpoint, json={"query": test_query}, headers=headers
-            )
+            response = self.session.post(self.endpoint, json={"query": test_query})
             response.raise_for_status()
             response_data = response.json()
 
@@ -459,8 +561,8 @@ class HasuraExtractor:
                         full_query = self._build_graphql_query(
                             view_name, available_fields, limit
                         )
-                        full_response = requests.post(
-                            self.endpoint, json={"query": full_query}, headers=headers
+                        full_response = self.session.post(
+                            self.endpoint, json={"query": full_query}
                         )
                         full_response.raise_for_status()
                         full_data = full_response.json()
@@ -475,17 +577,30 @@ class HasuraExtractor:
         return []
 
     def _build_graphql_query(
-        self, view_name: str, fields: List[str], limit: Optional[int] = None
+        self,
+        view_name: str,
+        fields: List[str],
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        order_by: Optional[List[str]] = None,
     ) -> str:
         """Build GraphQL query for a materialized view with specified fields."""
-        limit_clause = f"(limit: {limit})" if limit else ""
+        arguments = []
+        if order_by:
+            order_clause = ", ".join(f"{{{column}: asc}}" for column in order_by)
+            arguments.append(f"order_by: [{order_clause}]")
+        if limit:
+            arguments.append(f"limit: {limit}")
+        if offset:
+            arguments.append(f"offset: {offset}")
+        args_clause = f"({', '.join(arguments)})" if arguments else ""
 
         # Build the fields selection
         fields_selection = "\n                ".join(fields)
 
         query = f"""
         query {{
-            {view_name}{limit_clause} {{
+            {view_name}{args_clause} {{
                 {fields_selection}
             }}
         }}
@@ -17,11 +17,15 @@ NEO4J_USERNAME = os.getenv("NEO4J_USERNAME")
 NEO4J_PASSWORD = os.getenv("NEO4J_PASSWORD")
 NEO4J_DATABASE = os.getenv("NEO4J_DATABASE", "neo4j")
 
+# Default for the count methods' stats argument: fetch the stats themselves
+FETCH_STATS = object()
+
 
 class SchemaIntrospector:
     def __init__(self, uri, username, password, database):
         self.driver = GraphDatabase.driver(uri, auth=(username, password))
         self.database = database
+        self.session = None
 
     def close(self):
         self.driver.close()
@@ -33,15 +37,49 @@ class SchemaIntrospector:
         print(f"{'=' * 80}")
         print(f"{query}\n")
 
+        # Reuse the introspection session when one is open
+        if self.session is not None:
+            return self._print_records(self.session.run(query))
+
         with self.driver.session(database=self.database) as session:
-            result = session.run(query)
-            records = [record.data() for record in result]
-            print(f"Results ({len(records)} records):")
-            print(json.dumps(records, indent=2, default=str))
-            return records
-
-    def get_node_labels_and_counts(self):
-        """Get all node labels and their counts"""
+            return self._print_records(session.run(query))
+
+    def _print_records(self, result):
+        """Print query results as NDJSON while streaming and return them as dicts"""
+        records = []
+        for record in result:
+            data = record.data()
+            print(json.dumps(data, default=str))
+            records.append(data)
+        print(f"Results ({len(records)} records)")
+        return records
+
+    def get_count_store_stats(self):
+        """Get label and relationship type counts from the count store"""
+        query = """
+        CALL apoc.meta.stats() YIELD labels, relTypesCount
+        RETURN labels, relTypesCount
+        """
+        return self.run_query(query, "Count Store Statistics (APOC)")[0]
+
+    def _try_count_store_stats(self):
+        """Count store statistics, or None when APOC is unavailable"""
+        try:
+            return self.get_count_store_stats()
+        except Exception as e:
+            print(f"Warning: apoc.meta.stats unavailable, counting directly: {e}")
+            return None
+
+    def get_node_labels_and_counts(self, stats=FETCH_STATS):
+        """Get all node labels and their counts (stats=None forces direct counting)"""
+        if stats is FETCH_STATS:
+            stats = self._try_count_store_stats()
+        if stats is not None:
+            return [
+                {"label": label, "count": count}
+                for label, count in sorted(stats["labels"].items())
+            ]
+
         query = """
         CALL db.labels() YIELD label
         CALL {
@@ -54,8 +92,16 @@ class SchemaIntrospector:
         """
         return self.run_query(query, "Node Labels and Counts")
 
-    def get_relationship_types_and_counts(self):
-        """Get all relationship types and their counts"""
+    def get_relationship_types_and_counts(self, stats=FETCH_STATS):
+        """Get all relationship types and their counts (stats=None counts directly)"""
+        if stats is FETCH_STATS:
+            stats = self._try_count_store_stats()
+        if stats is not None:
+            return [
+                {"relationshipType": rel_type, "count": count}
+                for rel_type, count in sorted(stats["relTypesCount"].items())
+            ]
+
         query = """
         CALL db.relationshipTypes() YIELD relationshipType
         CALL {
@@ -78,14 +124,17 @@ class SchemaIntrospector:
         return self.run_query(query, f"Sample Nodes for Label: {label}")
 
     def get_all_sample_nodes(self):
-        """Get sample nodes for all labels"""
-        labels_result = self.get_node_labels_and_counts()
-        all_samples = {}
-        for record in labels_result:
-            label = record["label"]
-            samples = self.get_sample_nodes_for_label(label)
-            all_samples[label] = samples
-        return all_samples
+        """Get sample nodes for all labels, one label scan per label"""
+        query = """
+        CALL db.labels() YIELD label
+        RETURN label
+        ORDER BY label
+        """
+        records = self.run_query(query, "Node Labels")
+        return {
+            record["label"]: self.get_sample_nodes_for_label(record["label"])
+            for record in records
+        }
 
     def get_relationship_patterns(self):
         """Get all relationship patterns with counts"""
@@ -112,7 +161,31 @@ class SchemaIntrospector:
         return self.run_query(query, f"Properties for Label: {label}")
 
     def get_all_properties(self):
-        """Get properties for all labels"""
+        """Get properties for all labels from the schema procedure"""
+        query = """
+        CALL db.schema.nodeTypeProperties()
+        YIELD nodeLabels, propertyName, propertyTypes
+        UNWIND nodeLabels as label
+        RETURN label, propertyName as key, propertyTypes as types
+        ORDER BY label, key
+        """
+        try:
+            records = self.run_query(query, "Properties for All Labels")
+        except Exception as e:
+            print(f"Warning: db.schema.nodeTypeProperties failed: {e}")
+            return self._get_all_properties_by_label()
+
+        all_properties = {}
+        for record in records:
+            if record["key"] is None:
+                continue
+            all_properties.setdefault(record["label"], []).append(
+                {"key": record["key"], "types": record["types"]}
+            )
+        return all_properties
+
+    def _get_all_properties_by_label(self):
+        """Get properties for all labels one label at a time"""
         labels_result = self.get_node_labels_and_counts()
         all_properties = {}
         for record in labels_result:
@@ -142,11 +215,28 @@ class SchemaIntrospector:
         print("NEO4J SCHEMA INTROSPECTION")
         print("=" * 80)
 
+        # One session for every introspection query
+        with self.driver.session(database=self.database) as session:
+            self.session = session
+            try:
+                self._run_introspection_queries()
+            finally:
+                self.session = None
+
+        print("\n" + "=" * 80)
+        print("INTROSPECTION COMPLETE")
+        print("=" * 80)
+
+    def _run_introspection_queries(self):
+        """Run each introspection step"""
+        # One apoc.meta.stats() call serves both counts
+        stats = self._try_count_store_stats()
+
         # 1. Node labels and counts
-        self.get_node_labels_and_counts()
+        self.get_node_labels_and_counts(stats)
 
         # 2. Relationship types and counts
-        self.get_relationship_types_and_counts()
+        self.get_relationship_types_and_counts(stats)
 
         # 3. Relationship patterns
         self.get_relationship_patterns()
@@ -163,10 +253,6 @@ class SchemaIntrospector:
         print("=" * 80)
         self.get_all_properties()
 
-        print("\n" + "=" * 80)
-        print("INTROSPECTION COMPLETE")
-        print("=" * 80)
-
 
 def main():
     """Main execution"""
@@ -6,14 +6,14 @@ Executes the complete pipeline with a single command.
 
 import os
 import sys
+import json
+import shutil
+import hashlib
 import logging
 from pathlib import Path
 
 from dotenv import load_dotenv
 from config_manager import ConfigManager, ConfigurationError
-from hasura_extractor import HasuraExtractor
-from data_cleaner import DataCleaner
-from schema_mapper import SchemaMapper
 
 
 def setup_logging():
@@ -31,11 +31,8 @@ def setup_logging():
 def validate_environment():
     """Validate required environment variables are set."""
     required_vars = ["HASURA_ENDPOINT", "HASURA_API_KEY", "OAK_AUTH_TYPE"]
-    missing_vars = []
-
-    for var in required_vars:
-        if not os.getenv(var):
-            missing_vars.append(var)
+    # Unset and empty values both count as missing
+    missing_vars = [var for var in required_vars if not os.environ.get(var)]
 
     if missing_vars:
         print("❌ Missing required environment variables:")
@@ -57,21 +54,74 @@ def find_config_file():
     # Use the default config file if it exists
     preferred_path = config_dir / DEFAULT_CONFIG_FILE
 
-    if preferred_path.exists():
+    if preferred_path.is_file():
         print(f"📋 Using configuration file: {DEFAULT_CONFIG_FILE}")
         return DEFAULT_CONFIG_FILE
 
-    # Fallback to other config files
-    config_files = list(config_dir.glob("*.json"))
-
-    if not config_files:
-        print("❌ No configuration files found in config/ directory")
-        sys.exit(1)
-
-    # Use the first config file found
-    config_file = config_files[0].name
-    print(f"📋 Using configuration file: {config_file}")
-    return config_file
+    # Fallback to the first other config file found
+    if config_dir.is_dir():
+        with os.scandir(config_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(".json") and entry.is_file():
+                    print(f"📋 Using configuration file: {entry.name}")
+                    return entry.name
+
+    print("❌ No configuration files found in config/ directory")
+    sys.exit(1)
+
+
+def sweep_files(output_dir, matches):
+    """Delete regular files in output_dir whose name matches; return the count."""
+    with os.scandir(output_dir) as entries:
+        stale_paths = [
+            entry.path
+            for entry in entries
+            if not entry.name.startswith(".")
+            and entry.is_file(follow_symlinks=False)
+            and matches(entry.name)
+        ]
+
+    for path in stale_paths:
+        os.unlink(path)
+    return len(stale_paths)
+
+
+def is_neo4j_csv(name):
+    """Match node and relationship CSVs written by SchemaMapper."""
+    return name.endswith(".csv") and ("nodes" in name or "relationships" in name)
+
+
+# Hasura exports kept in data/.cache when cache_hasura_export is enabled
+EXPORT_CACHE_DIR = ".cache"
+EXPORT_CACHE_ENTRIES = 3
+
+
+def get_export_cache_path(config, materialized_views, output_dir):
+    """Cache path for the Hasura export produced by this extraction config."""
+    extraction = {
+        "hasura_endpoint": config["hasura_endpoint"],
+        "materialized_views": materialized_views,
+        "join_strategy": config["join_strategy"],
+        "test_limit": config.get("test_limit"),
+    }
+    cache_key = hashlib.sha256(
+        json.dumps(extraction, sort_keys=True).encode()
+    ).hexdigest()
+    return output_dir / EXPORT_CACHE_DIR / f"extract-{cache_key[:16]}.csv"
+
+
+def save_export_cache(csv_file, cache_path):
+    """Copy a fresh Hasura export into the cache, keeping the newest entries."""
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(csv_file, cache_path)
+
+    cached_exports = sorted(
+        cache_path.parent.glob("extract-*.csv"),
+        key=lambda path: path.stat().st_mtime,
+        reverse=True,
+    )
+    for stale_export in cached_exports[EXPORT_CACHE_ENTRIES:]:
+        stale_export.unlink()
 
 
 def main():
@@ -110,26 +160,51 @@ def main():
         if export_from_hasura:
             print("🔄 Hasura Export: Extracting and cleaning data from Hasura...")
 
+            # Imported here so runs that skip this stage don't pay for them
+            from hasura_extractor import HasuraExtractor
+            from data_cleaner import DataCleaner
+
             # Clear ALL existing files before Hasura Export
-            import glob
-
-            existing_files = glob.glob(str(output_dir / "*"))
-            for file_path in existing_files:
-                if os.path.isfile(file_path):
-                    os.remove(file_path)
-            if existing_files:
-                logger.info(f"Cleared {len(existing_files)} existing files")
-
-            # Extract data
-            extractor = HasuraExtractor(
-                endpoint=config["hasura_endpoint"], output_dir=str(output_dir)
-            )
+            removed = sweep_files(output_dir, lambda name: True)
+            if removed:
+                logger.info(f"Cleared {removed} existing files")
+
+            # Only query fields that filters, joins or schema_mapping use
+            materialized_views = config["materialized_views"]
+            keep_columns = None
+            if config.get("prune_unused_fields", False):
+                materialized_views = config_manager.prune_materialized_views(config)
+                keep_columns = config_manager.get_referenced_columns(config)
+                logger.info("Pruned materialized view fields not used downstream")
+
+            cache_path = None
+            if config.get("cache_hasura_export", False):
+                cache_path = get_export_cache_path(
+                    config, materialized_views, output_dir
+                )
 
-            csv_file = extractor.extract_and_join(
-                materialized_views=config["materialized_views"],
-                join_strategy=config["join_strategy"],
-                test_limit=config.get("test_limit"),
-            )
+            if cache_path and cache_path.is_file():
+                # Reuse the export from a previous run with the same config
+                csv_file = str(output_dir / "consolidated_data.csv")
+                shutil.copyfile(cache_path, csv_file)
+                logger.info(f"Using cached Hasura export: {cache_path}")
+            else:
+                # Extract data
+                extractor = HasuraExtractor(
+                    endpoint=config["hasura_endpoint"],
+                    output_dir=str(output_dir),
+                    page_size=config.get("page_size"),
+                    page_order_by=config.get("page_order_by"),
+                )
+
+                csv_file = extractor.extract_and_join(
+                    materialized_views=materialized_views,
+                    join_strategy=config["join_strategy"],
+                    test_limit=config.get("test_limit"),
+                )
+
+                if cache_path:
+                    save_export_cache(csv_file, cache_path)
 
             # Always clean data (includes synthetic column generation)
             cleaner = DataCleaner(
@@ -137,6 +212,7 @@ def main():
                 filters=config.get("filters"),
                 schema_mapping=config.get("schema_mapping"),
                 array_expansion=config.get("array_expansion", {}),
+                keep_columns=keep_columns,
             )
             cleaned_csv_file = cleaner.clean_data(csv_file)
 
@@ -147,16 +223,9 @@ def main():
             print("🔄 Neo4j Import: Mapping schema and importing to Neo4j...")
 
             # Clear Neo4j CSV files before Neo4j Import (preserve Hasura Export outputs)
-            import glob
-
-            neo4j_files = glob.glob(str(output_dir / "*nodes*.csv")) + glob.glob(
-                str(output_dir / "*relationships*.csv")
-            )
-            for file_path in neo4j_files:
-                if os.path.isfile(file_path):
-                    os.remove(file_path)
-            if neo4j_files:
-                logger.info(f"Cleared {len(neo4j_files)} existing Neo4j CSV files")
+            removed = sweep_files(output_dir, is_neo4j_csv)
+            if removed:
+                logger.info(f"Cleared {removed} existing Neo4j CSV files")
 
             # Find input file for Neo4j Import
             if not cleaned_csv_file:
@@ -172,6 +241,8 @@ def main():
                 logger.info(f"Using existing CSV file: {cleaned_csv_file}")
 
             # Map to Neo4j schema
+            from schema_mapper import SchemaMapper
+
             mapper = SchemaMapper()
             csv_files = mapper.map_from_csv(
                 csv_file=cleaned_csv_file,
@@ -191,7 +262,8 @@ def main():
             node_files = csv_files.get("node_files", [])
             rel_files = csv_files.get("relationship_files", [])
 
-            import_stats = loader.execute_import(node_files, rel_files)
+            with loader:
+                import_stats = loader.execute_import(node_files, rel_files)
 
             if import_stats.get("success", False):
                 queries = import_stats.get("queries_executed", 0)
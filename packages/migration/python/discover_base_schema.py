@@ -20,8 +20,9 @@ Focuses on discovering:
 
 import os
 import json
-from typing import Dict, List, Any, Optional, Set
-from dataclasses import dataclass, asdict
+import asyncio
+from typing import Dict, List, Any, Optional, Set, Tuple
+from dataclasses import dataclass, fields, is_dataclass
 from datetime import datetime
 import re
 
@@ -39,8 +40,81 @@ load_dotenv()
 
 console = Console()
 
-
-@dataclass
+# Patterns that indicate computed/derived types (NOT base tables)
+EXCLUDE_PATTERNS = [
+    # Aggregation types
+    "_aggregate",
+    "_aggregate_fields",
+    "_avg_fields",
+    "_max_fields",
+    "_min_fields",
+    "_stddev_fields",
+    "_stddev_pop_fields",
+    "_stddev_samp_fields",
+    "_sum_fields",
+    "_var_pop_fields",
+    "_var_samp_fields",
+    "_variance_fields",
+    # Computed/materialized views
+    "published_mv_",
+    "published_view_",
+    # Versioned/filtered views
+    "_by_year_",
+    "_by_keystage_",
+    "_canonical_",
+    "_browse_",
+    "_synthetic_",
+    "_redirects_",
+    "_openapi_",
+    # System types
+    "__",
+    "query_root",
+    "mutation_root",
+    "subscription_root",
+]
+
+# One compiled alternation scans a type name once instead of once per pattern
+_EXCLUDE_RE = re.compile("|".join(re.escape(p) for p in EXCLUDE_PATTERNS))
+
+# Aliased aggregate counts sent per GraphQL request
+ROW_COUNT_BATCH_SIZE = 50
+
+# Row count requests allowed in flight at once
+ROW_COUNT_CONCURRENCY = 8
+
+# Field types that can hold an *_id foreign key
+_FK_TYPES = frozenset({"ID", "String", "Int", "uuid"})
+_SLUG_FK_TYPES = frozenset({"String", "ID"})
+
+# Specific Oak curriculum slug references: field -> (table, field)
+_OAK_FK_PATTERNS = {
+    "programme_slug": ("programmes", "slug"),
+    "subject_slug": ("pf_subjects", "slug"),
+    "unit_slug": ("units", "slug"),
+    "lesson_slug": ("lessons", "slug"),
+    "thread_slug": ("programme_threads", "slug"),
+}
+
+
+def _type_key(type_info: Optional[Dict[str, Any]]) -> tuple:
+    """Flatten a nested ofType chain into a hashable (kind, name, ...) key."""
+    key = []
+    while type_info:
+        key += (type_info.get("kind"), type_info.get("name"))
+        type_info = type_info.get("ofType")
+    return tuple(key)
+
+
+def _json_default(value: Any) -> Any:
+    """Serialise dataclasses shallowly (no asdict deep copy) and datetimes."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if is_dataclass(value):
+        return {f.name: getattr(value, f.name) for f in fields(value)}
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+@dataclass(slots=True)
 class BaseTableField:
     """Information about a field in a base PostgreSQL table."""
 
@@ -52,7 +126,7 @@ class BaseTableField:
     references_field: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseTable:
     """Information about a base PostgreSQL table."""
 
@@ -84,6 +158,8 @@ class BaseSchemaDiscoverer:
         self.endpoint = endpoint
         self.admin_secret = admin_secret
         self.client = None
+        self._row_counts: Dict[str, Optional[int]] = {}
+        self._type_names: Dict[tuple, str] = {}
 
     def connect(self) -> None:
         """Connect to Hasura GraphQL endpoint."""
@@ -148,60 +224,29 @@ class BaseSchemaDiscoverer:
             console.print(f"❌ Schema introspection failed: {e}", style="red")
             raise
 
-    def identify_base_tables(self, schema_types: List[Dict]) -> List[str]:
+    def identify_base_tables(
+        self, schema_types: List[Dict]
+    ) -> Tuple[List[str], Dict[str, Dict]]:
         """
         Filter schema types to identify actual base PostgreSQL tables.
         Excludes computed views, aggregations, and materialized views.
+        Returns the base table names and a name -> type lookup of object types.
         """
 
-        # Patterns that indicate computed/derived types (NOT base tables)
-        exclude_patterns = [
-            # Aggregation types
-            "_aggregate",
-            "_aggregate_fields",
-            "_avg_fields",
-            "_max_fields",
-            "_min_fields",
-            "_stddev_fields",
-            "_stddev_pop_fields",
-            "_stddev_samp_fields",
-            "_sum_fields",
-            "_var_pop_fields",
-            "_var_samp_fields",
-            "_variance_fields",
-            # Computed/materialized views
-            "published_mv_",
-            "published_view_",
-            # Versioned/filtered views
-            "_by_year_",
-            "_by_keystage_",
-            "_canonical_",
-            "_browse_",
-            "_synthetic_",
-            "_redirects_",
-            "_openapi_",
-            # System types
-            "__",
-            "query_root",
-            "mutation_root",
-            "subscription_root",
-        ]
-
-        # Get object types only (tables/views)
-        object_types = [
-            t
-            for t in schema_types
-            if t.get("kind") == "OBJECT" and not t["name"].startswith("__")
-        ]
-
         base_tables = []
+        type_lookup = {}
         excluded_count = 0
 
-        for type_info in object_types:
+        for type_info in schema_types:
             type_name = type_info["name"]
 
+            # Object types only (tables/views)
+            if type_info.get("kind") != "OBJECT" or type_name.startswith("__"):
+                continue
+            type_lookup[type_name] = type_info
+
             # Check if this type should be excluded
-            is_excluded = any(pattern in type_name for pattern in exclude_patterns)
+            is_excluded = _EXCLUDE_RE.search(type_name) is not None
 
             if is_excluded:
                 excluded_count += 1
@@ -218,13 +263,23 @@ class BaseSchemaDiscoverer:
             f"Found {len(base_tables)} base tables, excluded {excluded_count} computed types",
             style="cyan",
         )
-        return base_tables
+        return base_tables, type_lookup
 
     def parse_graphql_type(self, type_info: Dict[str, Any]) -> str:
         """Parse GraphQL type info to readable string."""
         if not type_info:
             return "Unknown"
 
+        # Schemas repeat a handful of type shapes across many fields
+        key = _type_key(type_info)
+        type_name = self._type_names.get(key)
+        if type_name is None:
+            type_name = self._parse_graphql_type(type_info)
+            self._type_names[key] = type_name
+        return type_name
+
+    def _parse_graphql_type(self, type_info: Dict[str, Any]) -> str:
+        """Build the readable string for one GraphQL type tree."""
         kind = type_info.get("kind", "")
         name = type_info.get("name", "")
         of_type = type_info.get("ofType")
@@ -247,34 +302,25 @@ class BaseSchemaDiscoverer:
         """
 
         # Common foreign key patterns
-        if field_name.endswith("_id") and field_type in ["ID", "String", "Int", "uuid"]:
+        if field_name.endswith("_id") and field_type in _FK_TYPES:
             # Extract potential table name
             table_part = field_name[:-3]  # Remove '_id'
 
-            # Try different table naming patterns
-            potential_tables = [
-                table_part,  # lesson_id -> lesson
+            # Try different table naming patterns, most common first
+            if table_part in known_tables:  # lesson_id -> lesson
+                return True, table_part, "id"
+            for potential_table in (
                 f"{table_part}s",  # lesson_id -> lessons
                 table_part.replace("_", ""),  # unit_variant_id -> unitvariant
                 f"pf_{table_part}s",  # subject_id -> pf_subjects
                 f"cat_{table_part}",  # category_id -> cat_category
-            ]
-
-            for potential_table in potential_tables:
+            ):
                 if potential_table in known_tables:
                     return True, potential_table, "id"
 
         # Handle specific Oak curriculum patterns
-        oak_fk_patterns = {
-            "programme_slug": ("programmes", "slug"),
-            "subject_slug": ("pf_subjects", "slug"),
-            "unit_slug": ("units", "slug"),
-            "lesson_slug": ("lessons", "slug"),
-            "thread_slug": ("programme_threads", "slug"),
-        }
-
-        if field_name in oak_fk_patterns and field_type in ["String", "ID"]:
-            table, field = oak_fk_patterns[field_name]
+        if field_name in _OAK_FK_PATTERNS and field_type in _SLUG_FK_TYPES:
+            table, field = _OAK_FK_PATTERNS[field_name]
             if table in known_tables:
                 return True, table, field
 
@@ -308,8 +354,11 @@ class BaseSchemaDiscoverer:
             )
             fields.append(field)
 
-        # Try to get row count estimate
-        estimated_rows = self.get_table_row_count(table_name)
+        # Try to get row count estimate (prefetched in batches when available)
+        if table_name in self._row_counts:
+            estimated_rows = self._row_counts[table_name]
+        else:
+            estimated_rows = self.get_table_row_count(table_name)
 
         return BaseTable(name=table_name, fields=fields, estimated_rows=estimated_rows)
 
@@ -335,6 +384,45 @@ class BaseSchemaDiscoverer:
             # Many base tables might not have aggregate queries exposed
             return None
 
+    def get_table_row_counts(self, table_names: List[str]) -> Dict[str, Optional[int]]:
+        """Get row counts for many tables, one aliased query per batch."""
+        batches = [
+            table_names[start : start + ROW_COUNT_BATCH_SIZE]
+            for start in range(0, len(table_names), ROW_COUNT_BATCH_SIZE)
+        ]
+        results = asyncio.run(self._gather_row_counts(batches))
+
+        row_counts = {}
+        for batch, result in zip(batches, results):
+            if isinstance(result, Exception):
+                # One missing aggregate fails the whole batch; count individually
+                for name in batch:
+                    row_counts[name] = self.get_table_row_count(name)
+                continue
+
+            for i, name in enumerate(batch):
+                row_counts[name] = result[f"t{i}"]["aggregate"]["count"]
+
+        return row_counts
+
+    async def _gather_row_counts(self, batches: List[List[str]]) -> List[Any]:
+        """Run the batched count queries concurrently on one async session."""
+        semaphore = asyncio.Semaphore(ROW_COUNT_CONCURRENCY)
+
+        async with self.client as session:
+
+            async def fetch(batch: List[str]) -> Dict[str, Any]:
+                selections = "\n".join(
+                    f"t{i}: {name}_aggregate {{ aggregate {{ count }} }}"
+                    for i, name in enumerate(batch)
+                )
+                async with semaphore:
+                    return await session.execute(gql(f"query {{\n{selections}\n}}"))
+
+            return await asyncio.gather(
+                *(fetch(batch) for batch in batches), return_exceptions=True
+            )
+
     def extract_relationships(
         self, base_tables: List[BaseTable]
     ) -> List[Dict[str, Any]]:
@@ -379,16 +467,18 @@ class BaseSchemaDiscoverer:
             progress.remove_task(task)
 
         # Identify base tables (exclude computed views)
-        base_table_names = self.identify_base_tables(schema["types"])
+        base_table_names, type_lookup = self.identify_base_tables(schema["types"])
         console.print(
             f"📊 Identified {len(base_table_names)} base tables", style="green"
         )
 
         # Analyze each base table
-        type_lookup = {t["name"]: t for t in schema["types"]}
         known_tables = set(base_table_names)
         base_tables = []
 
+        # Fetch row counts up front instead of one request per table
+        self._row_counts = self.get_table_row_counts(base_table_names)
+
         for table_name in track(
             base_table_names, description="Analyzing base tables..."
         ):
@@ -443,12 +533,8 @@ class BaseSchemaDiscoverer:
     def save_analysis(self, analysis: BaseSchemaAnalysis, output_file: str) -> None:
         """Save base schema analysis to JSON file."""
 
-        # Convert to dict for JSON serialization
-        analysis_dict = asdict(analysis)
-        analysis_dict["analyzed_at"] = analysis.analyzed_at.isoformat()
-
         with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(analysis_dict, f, indent=2, ensure_ascii=False)
+            json.dump(analysis, f, indent=2, ensure_ascii=False, default=_json_default)
 
         console.print(f"💾 Base schema analysis saved to: {output_file}", style="green")
 
@@ -34,7 +34,7 @@ load_dotenv()
 console = Console()
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractionConfig:
     """Configuration for data extraction process."""
 
@@ -49,7 +49,7 @@ class ExtractionConfig:
     enable_logging: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class ExtractionStats:
     """Statistics for data extraction process."""
 
@@ -62,7 +62,7 @@ class ExtractionStats:
     sample_data: Optional[List[Dict]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DataQualityReport:
     """Data quality report for extracted tables."""
 
@@ -124,13 +124,15 @@ class PostgreSQLExtractor:
             "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
         )
 
-        # File handler
+        # File handler keeps the full INFO record
         file_handler = logging.FileHandler(log_file)
+        file_handler.setLevel(logging.INFO)
         file_handler.setFormatter(file_formatter)
         logger.addHandler(file_handler)
 
-        # Rich console handler for better terminal output
+        # Rich console handler only for warnings; progress is shown with Progress
         console_handler = RichHandler(console=console, show_path=False)
+        console_handler.setLevel(logging.WARNING)
         logger.addHandler(console_handler)
 
         return logger
@@ -1,14 +1,71 @@
 import os
+import re
+import csv
+import json
+import shutil
 import logging
+import tempfile
+import subprocess
+import numpy as np
 import pandas as pd
-from typing import Dict, List, Tuple, Any
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple, Any, Iterable, Iterator, Optional
 from neo4j import GraphDatabase
+from neo4j.exceptions import AuthError, ServiceUnavailable
 from dotenv import load_dotenv
 
+# String values treated as true for boolean properties
+TRUE_VALUES = ["true", "1", "yes", "on"]
+MAX_CONNECTION_POOL_SIZE = 50
+# Parallel node-batch writers; relationship batches always run one at a time
+DEFAULT_IMPORT_WORKERS = 4
+# Rows per transaction. Larger batches mean fewer commits and round trips
+# but more server heap per transaction; lower NEO4J_BATCH_SIZE on OOM errors
+DEFAULT_BATCH_SIZE = 20_000
+# Files with at least this many rows are sent in chunks of this size and
+# batched server-side, by CALL { } IN CONCURRENT TRANSACTIONS (Neo4j 5.23+)
+# or else apoc.periodic.iterate (when APOC is installed)
+SERVER_BATCH_MIN_ROWS = 100_000
+APOC_ITERATE_PREFIX = "CALL apoc.periodic.iterate"
+# CALL { } IN TRANSACTIONS only runs in auto-commit transactions
+IN_TRANSACTIONS_MARKER = "} IN "
+CONCURRENT_TRANSACTIONS_MIN_VERSION = (5, 23)
+# Header type suffixes as neo4j-admin spells them; datetimes stay text to
+# match the online import, and lists become ARRAY_DELIMITER-joined arrays
+ADMIN_HEADER_TYPES = {
+    "int": "long",
+    "float": "double",
+    "boolean": "boolean",
+    "list": "string[]",
+}
+ADMIN_ARRAY_DELIMITER = ";"
+# Suffix of split files, e.g. unit_lesson_part2_relationships.csv
+_PART_RE = re.compile(r"_part\d+")
+
+
+@dataclass
+class ColumnPlan:
+    """Roles of a CSV file's header columns, worked out once per file"""
+
+    id_col: Optional[str] = None
+    id_prop: Optional[str] = None
+    label_col: Optional[str] = None
+    start_id_col: Optional[str] = None
+    end_id_col: Optional[str] = None
+    type_col: Optional[str] = None
+    # (raw header, Neo4j property name) for every plain property column
+    property_cols: List[Tuple[str, str]] = field(default_factory=list)
+
 
 class AuraDBLoader:
     def __init__(
-        self, clear_before_import: bool = False, schema_config: Dict[str, Any] = None
+        self,
+        clear_before_import: bool = False,
+        schema_config: Dict[str, Any] = None,
+        keep_execution_summary: bool = False,
+        batch_size: int = None,
     ):
         load_dotenv()
         self.uri = os.getenv("NEO4J_URI")
@@ -17,7 +74,20 @@ class AuraDBLoader:
         self.database = os.getenv("NEO4J_DATABASE", "neo4j")
         self.clear_before_import = clear_before_import
         self.schema_config = schema_config or {}
+        # Per-batch details grow with the import, so they are opt-in
+        self.keep_execution_summary = keep_execution_summary
         self.logger = logging.getLogger(__name__)
+        self.batch_size = max(
+            1, batch_size or int(os.getenv("NEO4J_BATCH_SIZE") or DEFAULT_BATCH_SIZE)
+        )
+        self.import_workers = max(
+            1, int(os.getenv("NEO4J_IMPORT_WORKERS") or DEFAULT_IMPORT_WORKERS)
+        )
+
+        # Case-insensitive node config lookup (first matching key wins)
+        self._node_configs = {}
+        for config_key, node_config in self.schema_config.get("nodes", {}).items():
+            self._node_configs.setdefault(config_key.lower(), node_config)
 
         if not all([self.uri, self.username, self.password]):
             raise ValueError(
@@ -25,14 +95,54 @@ class AuraDBLoader:
                 "NEO4J_USERNAME, and NEO4J_PASSWORD environment variables."
             )
 
+        # Created on first use and shared (with its connection pool) until close()
+        self._driver = None
+        # Set by execute_import once it has checked what the server supports;
+        # node MERGEs only run in parallel behind uniqueness constraints
+        self._parallel_node_merge = False
+        self._concurrent_tx_available = False
+        self._apoc_available = False
+
+    def _get_driver(self):
+        """Return the loader's driver, creating it on first use"""
+        if self._driver is None:
+            # Configure driver with longer timeouts for large imports
+            driver = GraphDatabase.driver(
+                self.uri,
+                auth=(self.username, self.password),
+                connection_timeout=30.0,  # 30 seconds connection timeout
+                connection_acquisition_timeout=120.0,
+                max_connection_lifetime=3600,
+                max_connection_pool_size=MAX_CONNECTION_POOL_SIZE,
+            )
+            # Fail fast on bad credentials/URI, once per driver rather than per batch
+            try:
+                driver.verify_connectivity()
+            except Exception:
+                driver.close()
+                raise
+            self._driver = driver
+        return self._driver
+
+    def close(self) -> None:
+        """Close the shared driver and its connection pool"""
+        if self._driver is not None:
+            self._driver.close()
+            self._driver = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
     def test_connection(self) -> Tuple[bool, str]:
         try:
             # Simple connection pattern matching working script
-            driver = GraphDatabase.driver(self.uri, auth=(self.username, self.password))
-            with driver.session() as session:
+            driver = self._get_driver()
+            with driver.session(database=self.database) as session:
                 result = session.run("RETURN 1 as test")
                 test_value = result.single()["test"]
-                driver.close()
                 return True, f"Connection successful! Test returned: {test_value}"
         except Exception as e:
             return False, f"Connection failed: {str(e)}"
@@ -41,195 +151,116 @@ class AuraDBLoader:
         self,
         node_files: List[str],
         relationship_files: List[str],
-        batch_size: int = 1000,
-    ) -> List[Tuple[str, Dict]]:
+        batch_size: int = None,
+    ) -> Iterator[Tuple[str, Dict]]:
         """Generate UNWIND batch queries for high-performance import"""
-        queries = []
-
+        batch_size = batch_size or self.batch_size
         # Generate node import queries
         for node_file in node_files:
             if os.path.exists(node_file):
-                batch_queries = self._generate_node_batch_queries(node_file, batch_size)
-                queries.extend(batch_queries)
+                yield from self._generate_node_batch_queries(node_file, batch_size)
 
         # Generate relationship import queries
         for rel_file in relationship_files:
             if os.path.exists(rel_file):
-                batch_queries = self._generate_relationship_batch_queries(
+                yield from self._generate_relationship_batch_queries(
                     rel_file, batch_size
                 )
-                queries.extend(batch_queries)
-
-        return queries
-
-    def _generate_node_load_query(self, csv_file: str) -> str:
-        # Read CSV headers to build dynamic query
-        df = pd.read_csv(csv_file, nrows=0)
-
-        # Extract label from filename or use default
-        filename = os.path.basename(csv_file)
-        if "_nodes.csv" in filename:
-            label = filename.replace("_nodes.csv", "").title()
-        else:
-            label = "Node"
-
-        # Build property assignments (remove type annotations for Cypher)
-        properties = []
-        for col in df.columns:
-            if col == ":ID":
-                continue  # Skip ID column
-            elif col == ":LABEL":
-                continue  # Skip label column, use dynamic label
-            elif ":" in col:
-                prop_name = col.split(":")[0]
-                properties.append(f"{prop_name}: row.`{col}`")
-            else:
-                properties.append(f"{col}: row.`{col}`")
-
-        property_string = ", ".join(properties) if properties else ""
-
-        query = f"""
-LOAD CSV WITH HEADERS FROM 'file:///{csv_file}' AS row
-CREATE (n:{label} {{id: row.`:ID`{', ' + property_string if property_string else ''}}})
-"""
-        return query.strip()
-
-    def _generate_relationship_load_query(self, csv_file: str) -> str:
-        # Read CSV to get headers and relationship type
-        df_sample = pd.read_csv(csv_file, nrows=1)  # Read one row to get :TYPE value
-        df_headers = pd.read_csv(csv_file, nrows=0)  # Get just headers for column info
-
-        # Extract relationship type from :TYPE column in CSV (not filename)
-        if ":TYPE" in df_sample.columns and not df_sample.empty:
-            rel_type = df_sample[":TYPE"].iloc[
-                0
-            ]  # Get the relationship type from the first row
-        else:
-            # Fallback to filename if :TYPE column is missing
-            filename = os.path.basename(csv_file)
-            if "_relationships.csv" in filename:
-                rel_type = filename.replace("_relationships.csv", "").upper()
-            else:
-                rel_type = "RELATED_TO"
-
-        # Build property assignments (remove type annotations for Cypher)
-        properties = []
-        for col in df_headers.columns:
-            if col in [":START_ID", ":END_ID", ":TYPE"]:
-                continue  # Skip special columns
-            elif ":" in col:
-                prop_name = col.split(":")[0]
-                properties.append(f"{prop_name}: row.`{col}`")
-            else:
-                properties.append(f"{col}: row.`{col}`")
-
-        property_string = ", ".join(properties) if properties else ""
-
-        query = f"""
-LOAD CSV WITH HEADERS FROM 'file:///{csv_file}' AS row
-MATCH (start {{id: row.`:START_ID`}})
-MATCH (end {{id: row.`:END_ID`}})
-CREATE (start)-[r:{rel_type}{{{property_string}}}]->(end)
-"""
-        return query.strip()
 
     def _generate_node_batch_queries(
         self, csv_file: str, batch_size: int
-    ) -> List[Tuple[str, Dict]]:
+    ) -> Iterator[Tuple[str, Dict]]:
         """Generate UNWIND batch queries for high-performance node import"""
-        df = pd.read_csv(csv_file, low_memory=False)
+        # Only the header is needed up front; rows are streamed per batch below
+        header = pd.read_csv(csv_file, nrows=0)
 
-        # Extract label from filename
-        filename = os.path.basename(csv_file)
-        if "_nodes" in filename:
-            # Handle both original and split files (e.g., lesson_nodes.csv or lesson_nodes_part1.csv)
-            base_name = filename.split("_nodes")[0]
-            label = base_name.replace("sample_", "").title()
-        else:
-            label = "Node"
+        label = self._node_label(csv_file)
+        plan = self._parse_columns(header.columns)
 
-        # Find ID field and build property mappings
-        id_field = None
-        id_property = None
-        property_assignments = []
-        other_properties = []
-
-        for col in df.columns:
-            if col in [":LABEL"]:
-                continue
-            elif ":" in col and ":ID(" in col:
-                # This is the ID field
-                id_property = col.split(":")[0]
-                id_field = col
-            elif ":" in col:
-                prop_name = col.split(":")[0]
-                other_properties.append(f"{prop_name}: row.{prop_name}")
-            else:
-                other_properties.append(f"{col}: row.{col}")
-
-        # Create MERGE query template using ID field
-        if id_field and id_property:
-            other_props_string = ", ".join(other_properties) if other_properties else ""
-            if other_props_string:
-                query_template = f"""
-UNWIND $batch AS row
-MERGE (n:{label} {{{id_property}: row.{id_property}}})
-SET n += {{{other_props_string}}}
-""".strip()
-            else:
-                query_template = f"""
-UNWIND $batch AS row
-MERGE (n:{label} {{{id_property}: row.{id_property}}})
+        # Batches are columnar ($ids[i], $props.name[i]), so each property
+        # name crosses the wire once per batch rather than once per row
+        prop_names = [prop_name for _, prop_name in plan.property_cols]
+        if plan.id_col and plan.id_prop:
+            query_template = f"""
+UNWIND range(0, $rows - 1) AS i
+MERGE (n:{label} {{{plan.id_prop}: $ids[i]}})
+{self._columnar_set_clause("n", prop_names, keep_existing=True)}
 """.strip()
         else:
             # Fallback to CREATE if no ID field found
-            all_props = ", ".join(property_assignments)
             query_template = f"""
-UNWIND $batch AS row
-CREATE (n:{label} {{{all_props}}})
+UNWIND range(0, $rows - 1) AS i
+CREATE (n:{label})
+{self._columnar_set_clause("n", prop_names, keep_existing=False)}
 """.strip()
 
-        # Process data in batches
-        queries = []
-        for i in range(0, len(df), batch_size):
-            batch_df = df.iloc[i : i + batch_size]
-
-            # Convert batch to list of dicts with proper types
-            batch_data = []
-            for _, row in batch_df.iterrows():
-                record = {}
-
-                for col in df.columns:
-                    if col in [":LABEL"]:
-                        continue
-                    elif ":" in col:
-                        prop_name = col.split(":")[0]
-                        value = row[col]
-                        if not pd.isna(value):
-                            # Get proper field type from config and convert
-                            field_type = self._get_property_field_type(label, prop_name)
-                            record[prop_name] = self._convert_to_type(value, field_type)
-                    else:
-                        value = row[col]
-                        if not pd.isna(value):
-                            record[col] = str(value)
-
-                batch_data.append(record)
-
-            # Add query with parameters
-            queries.append((query_template, {"batch": batch_data}))
-
-        return queries
+        # Cast whole columns to their configured types once, not cell by cell
+        column_types = self._node_column_types(label, plan)
+
+        # Stream the file in batch-sized chunks; values are read as text and
+        # cast per schema so every chunk gets the same types
+        chunk_size, server_side = self._chunking_for(csv_file, batch_size)
+        with pd.read_csv(csv_file, chunksize=chunk_size, dtype=str) as reader:
+            for batch_df in reader:
+                parameters = self._node_batch_columns(batch_df, column_types, plan)
+                if server_side:
+                    # Distinct ids only stay distinct nodes under a uniqueness
+                    # constraint, so inner batches run in parallel only then
+                    yield self._server_side_batch(
+                        query_template,
+                        parameters,
+                        batch_size,
+                        parallel=self._parallel_node_merge,
+                    )
+                else:
+                    yield query_template, parameters
+
+    def _node_column_types(self, label: str, plan: ColumnPlan) -> Dict[str, str]:
+        """Configured field type of each column a node batch casts"""
+        column_types = {
+            col: (
+                self._get_property_field_type(label, prop_name)
+                if col != prop_name
+                else "string"  # Unannotated columns stay text
+            )
+            for col, prop_name in plan.property_cols
+        }
+        if plan.id_col:
+            column_types[plan.id_col] = self._get_property_field_type(
+                label, plan.id_prop
+            )
+        return column_types
+
+    def _node_batch_columns(
+        self,
+        batch_df: pd.DataFrame,
+        column_types: Dict[str, str],
+        plan: ColumnPlan,
+    ) -> Dict[str, Any]:
+        """Convert one chunk of a node CSV to columnar {rows, ids, props} parameters"""
+        batch_df = self._cast_dataframe(batch_df, column_types)
+
+        parameters = {
+            "rows": len(batch_df),
+            "props": {
+                prop_name: self._column_values(batch_df[col])
+                for col, prop_name in plan.property_cols
+            },
+        }
+        if plan.id_col:
+            parameters["ids"] = self._column_values(batch_df[plan.id_col])
+        return parameters
 
     def _generate_relationship_batch_queries(
         self, csv_file: str, batch_size: int
-    ) -> List[Tuple[str, Dict]]:
+    ) -> Iterator[Tuple[str, Dict]]:
         """Generate UNWIND batch queries for high-performance relationship import"""
-        df = pd.read_csv(csv_file, low_memory=False)
+        # Header plus first row (for :TYPE); rows are streamed per batch below
+        header = pd.read_csv(csv_file, nrows=1, dtype=str)
 
         # Extract relationship type from :TYPE column in CSV (not filename)
-        if ":TYPE" in df.columns and not df.empty:
-            rel_type = df[":TYPE"].iloc[
+        if ":TYPE" in header.columns and not header.empty:
+            rel_type = header[":TYPE"].iloc[
                 0
             ]  # Get the relationship type from the first row
         else:
@@ -244,161 +275,245 @@ CREATE (n:{label} {{{all_props}}})
             else:
                 rel_type = "RELATED_TO"
 
-        # Find START_ID and END_ID columns (they now have node type suffixes)
-        start_id_col = None
-        end_id_col = None
-        start_node_type = None
-        end_node_type = None
-
-        for col in df.columns:
-            if col.startswith(":START_ID"):
-                start_id_col = col
-                # Extract node type from :START_ID(NodeType)
-                if "(" in col and ")" in col:
-                    start_node_type = col.split("(")[1].split(")")[0]
-            elif col.startswith(":END_ID"):
-                end_id_col = col
-                # Extract node type from :END_ID(NodeType)
-                if "(" in col and ")" in col:
-                    end_node_type = col.split("(")[1].split(")")[0]
-
-        # Build property mapping for query template
-        property_assignments = []
-        for col in df.columns:
-            if col == start_id_col or col == end_id_col or col == ":TYPE":
-                continue
-            elif ":" in col:
-                prop_name = col.split(":")[0]
-                property_assignments.append(f"{prop_name}: row.{prop_name}")
-            else:
-                property_assignments.append(f"{col}: row.{col}")
+        # START_ID and END_ID columns carry node type suffixes, e.g. :START_ID(Unit)
+        plan = self._parse_columns(header.columns)
+        start_node_type = self._id_space(plan.start_id_col)
+        end_node_type = self._id_space(plan.end_id_col)
 
         # Get relationship config to use correct property names
-        filename = os.path.basename(csv_file)
-        # Handle split files by removing _partX suffix
-        base_filename = filename
-        for i in range(1, 10):  # Handle up to part9
-            base_filename = base_filename.replace(f"_part{i}", "")
-        rel_config_key = base_filename.replace("_relationships.csv", "")
-
-        relationships_config = self.schema_config.get("relationships", {})
-        rel_config = relationships_config.get(rel_config_key, {})
-
+        rel_config_key = self._relationship_config_key(csv_file)
 
         # Get the Neo4j property names for matching nodes
         start_prop = self._get_id_property_name(start_node_type)
         end_prop = self._get_id_property_name(end_node_type)
 
-        # Include properties in relationship creation
-        prop_string = ", ".join(property_assignments) if property_assignments else ""
-
-        query_template = (
-            f"""
-UNWIND $batch AS row
-MATCH (start:{start_node_type} {{{start_prop}: row.start_id}})
-MATCH (end:{end_node_type} {{{end_prop}: row.end_id}})
-MERGE (start)-[r:{rel_type}]->(end)
-SET r += {{{prop_string}}}
-""".strip()
-            if prop_string
-            else f"""
-UNWIND $batch AS row
-MATCH (start:{start_node_type} {{{start_prop}: row.start_id}})
-MATCH (end:{end_node_type} {{{end_prop}: row.end_id}})
+        # One MATCH pattern (two index seeks per row); a label is left out only
+        # when the header doesn't name the node type
+        start_label = f":{start_node_type}" if start_node_type else ""
+        end_label = f":{end_node_type}" if end_node_type else ""
+
+        # Columnar batches, as for nodes
+        prop_names = [prop_name for _, prop_name in plan.property_cols]
+        query_template = f"""
+UNWIND range(0, $rows - 1) AS i
+MATCH (start{start_label} {{{start_prop}: $start_ids[i]}}),
+      (end{end_label} {{{end_prop}: $end_ids[i]}})
 MERGE (start)-[r:{rel_type}]->(end)
+{self._columnar_set_clause("r", prop_names, keep_existing=True)}
 """.strip()
-        )
 
         # Debug logging
         self.logger.info(f"Generated query for {rel_config_key}: {query_template}")
 
-        # Process data in batches
-        queries = []
-        for i in range(0, len(df), batch_size):
-            batch_df = df.iloc[i : i + batch_size]
-
-            # Convert batch to list of dicts with proper types based on config
-            batch_data = []
-            for _, row in batch_df.iterrows():
-                # Get the correct types from config for start and end node IDs
-                start_id_type = self._get_id_field_type(start_node_type)
-                end_id_type = self._get_id_field_type(end_node_type)
-
-                record = {
-                    "start_id": self._convert_to_type(row[start_id_col], start_id_type),
-                    "end_id": self._convert_to_type(row[end_id_col], end_id_type),
-                }
+        # Cast whole columns to their configured types once, not cell by cell
+        column_types = self._relationship_column_types(rel_config_key, plan)
+
+        # Stream the file in batch-sized chunks, cast per schema as for nodes
+        chunk_size, server_side = self._chunking_for(csv_file, batch_size)
+        with pd.read_csv(csv_file, chunksize=chunk_size, dtype=str) as reader:
+            for batch_df in reader:
+                parameters = self._relationship_batch_columns(
+                    batch_df, column_types, plan
+                )
+                if server_side:
+                    # Serial inner batches: parallel ones deadlock on shared end nodes
+                    yield self._server_side_batch(
+                        query_template, parameters, batch_size, parallel=False
+                    )
+                else:
+                    yield query_template, parameters
+
+    @staticmethod
+    def _relationship_config_key(csv_file: str) -> str:
+        """schema_config relationships key for a relationship CSV"""
+        filename = os.path.basename(csv_file)
+        # Handle split files by removing _partX suffix
+        return _PART_RE.sub("", filename).replace("_relationships.csv", "")
+
+    def _relationship_column_types(
+        self, rel_config_key: str, plan: ColumnPlan
+    ) -> Dict[str, str]:
+        """Configured field type of each column a relationship batch casts"""
+        column_types = {
+            id_col: self._get_id_field_type(self._id_space(id_col))
+            for id_col in [plan.start_id_col, plan.end_id_col]
+        }
+        for col, prop_name in plan.property_cols:
+            if col == prop_name:
+                column_types[col] = "string"  # Unannotated columns stay text
+            else:
+                column_types[col] = self._get_relationship_property_type(
+                    rel_config_key, prop_name
+                )
+        return column_types
+
+    def _relationship_batch_columns(
+        self,
+        batch_df: pd.DataFrame,
+        column_types: Dict[str, str],
+        plan: ColumnPlan,
+    ) -> Dict[str, Any]:
+        """Convert one chunk of a relationship CSV to columnar UNWIND parameters"""
+        batch_df = self._cast_dataframe(batch_df, column_types)
+
+        return {
+            "rows": len(batch_df),
+            "start_ids": self._column_values(batch_df[plan.start_id_col]),
+            "end_ids": self._column_values(batch_df[plan.end_id_col]),
+            "props": {
+                prop_name: self._column_values(batch_df[col])
+                for col, prop_name in plan.property_cols
+            },
+        }
+
+    def _chunking_for(self, csv_file: str, batch_size: int) -> Tuple[int, bool]:
+        """Return (rows per chunk read, whether to batch server-side)"""
+        server_side = self._concurrent_tx_available or self._apoc_available
+        if server_side and self._count_rows(csv_file) >= SERVER_BATCH_MIN_ROWS:
+            return SERVER_BATCH_MIN_ROWS, True
+        return batch_size, False
+
+    @staticmethod
+    def _count_rows(csv_file: str) -> int:
+        """Count data lines without parsing (quoted newlines overcount slightly)"""
+        lines = 0
+        with open(csv_file, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                lines += block.count(b"\n")
+        return max(lines - 1, 0)
+
+    def _server_side_batch(
+        self,
+        query_template: str,
+        parameters: Dict[str, Any],
+        batch_size: int,
+        parallel: bool,
+    ) -> Tuple[str, Dict]:
+        """Wrap a chunk so the server splits it into batch_size transactions"""
+        if not self._concurrent_tx_available:
+            return self._apoc_iterate(query_template, parameters, batch_size, parallel)
+
+        # The template's first line is the UNWIND; the rest runs once per index i
+        unwind, inner = query_template.split("\n", 1)
+        concurrent = "CONCURRENT " if parallel else ""
+        query = f"""
+{unwind}
+CALL (i) {{
+{inner}
+{IN_TRANSACTIONS_MARKER}{concurrent}TRANSACTIONS OF {batch_size} ROWS
+""".strip()
+        return query, parameters
+
+    @staticmethod
+    def _apoc_iterate(
+        query_template: str, parameters: Dict[str, Any], batch_size: int, parallel: bool
+    ) -> Tuple[str, Dict]:
+        """Wrap a columnar UNWIND template so APOC batches its rows server-side"""
+        # The template's first line is the UNWIND; the rest runs once per index i
+        unwind, inner = query_template.split("\n", 1)
+        query = f"""
+{APOC_ITERATE_PREFIX}(
+  $outer, $inner,
+  {{batchSize: $batch_size, parallel: $parallel, params: $params}}
+)
+YIELD failedBatches, errorMessages, updateStatistics
+RETURN failedBatches, errorMessages, updateStatistics
+""".strip()
+        return query, {
+            "outer": f"{unwind} RETURN i",
+            "inner": inner,
+            "batch_size": batch_size,
+            "parallel": parallel,
+            "params": parameters,
+        }
+
+    @staticmethod
+    def _columnar_set_clause(
+        var: str, prop_names: List[str], keep_existing: bool
+    ) -> str:
+        """SET each property from its $props column; null cells set nothing"""
+        if not prop_names:
+            return ""
+        assignments = []
+        for prop_name in prop_names:
+            value = f"$props.`{prop_name}`[i]"
+            if keep_existing:
+                # Like SET += with the key left out: keep the stored value
+                value = f"coalesce({value}, {var}.`{prop_name}`)"
+            assignments.append(f"{var}.`{prop_name}` = {value}")
+        return "SET " + ", ".join(assignments)
+
+    @staticmethod
+    def _node_label(csv_file: str) -> str:
+        """Extract the node label from a node CSV's filename"""
+        filename = os.path.basename(csv_file)
+        if "_nodes" in filename:
+            # Handle both original and split files (e.g., lesson_nodes.csv or lesson_nodes_part1.csv)
+            base_name = filename.split("_nodes")[0]
+            return base_name.replace("sample_", "").title()
+        return "Node"
+
+    @staticmethod
+    def _parse_columns(columns) -> ColumnPlan:
+        """Classify header columns once so batches never re-split them"""
+        plan = ColumnPlan()
+        for col in columns:
+            if col == ":LABEL":
+                plan.label_col = col
+            elif col == ":TYPE":
+                plan.type_col = col
+            elif col.startswith(":START_ID"):
+                plan.start_id_col = col
+            elif col.startswith(":END_ID"):
+                plan.end_id_col = col
+            elif ":ID(" in col:
+                plan.id_col = col
+                plan.id_prop = col.split(":")[0]
+            else:
+                # Strip type annotations (name:int -> name) for Cypher
+                plan.property_cols.append((col, col.split(":")[0]))
+        return plan
 
-                for col in df.columns:
-                    if col == start_id_col or col == end_id_col or col == ":TYPE":
-                        continue
-                    elif ":" in col:
-                        prop_name = col.split(":")[0]
-                        value = row[col]
-                        if not pd.isna(value):
-                            # Get relationship config key from filename
-                            filename = os.path.basename(csv_file)
-                            rel_config_key = filename.replace("_relationships.csv", "")
-
-                            # Get proper field type from config and convert
-                            field_type = self._get_relationship_property_type(
-                                rel_config_key, prop_name
-                            )
-                            record[prop_name] = self._convert_to_type(value, field_type)
-                    else:
-                        value = row[col]
-                        if not pd.isna(value):
-                            record[col] = str(value)
-
-                batch_data.append(record)
-
-            # Add query with parameters
-            queries.append((query_template, {"batch": batch_data}))
-
-        return queries
+    @staticmethod
+    def _id_space(id_col: Optional[str]) -> Optional[str]:
+        """Extract NodeType from an :START_ID(NodeType)/:END_ID(NodeType) header"""
+        if id_col and "(" in id_col and ")" in id_col:
+            return id_col.split("(")[1].split(")")[0]
+        return None
 
     def _get_id_property_name(self, node_type: str) -> str:
         """Get the ID property name for a given node type from the schema config"""
-        nodes_config = self.schema_config.get("nodes", {})
-
-        # Look for the node type in config (try exact match first, then case variations)
-        for config_key, node_config in nodes_config.items():
-            if config_key.lower() == node_type.lower():
-                id_field_config = node_config.get("id_field", {})
-                return id_field_config.get("property_name", "id")
+        node_config = self._node_configs.get(node_type.lower()) if node_type else None
+        if node_config is not None:
+            id_field_config = node_config.get("id_field", {})
+            return id_field_config.get("property_name", "id")
 
         # Fallback
         return "id"
 
     def _get_id_field_type(self, node_type: str) -> str:
         """Get the ID field type for a given node type from the schema config"""
-        nodes_config = self.schema_config.get("nodes", {})
-
-        # Look for the node type in config
-        for config_key, node_config in nodes_config.items():
-            if config_key.lower() == node_type.lower():
-                id_field_config = node_config.get("id_field", {})
-                return id_field_config.get("type", "string")
+        node_config = self._node_configs.get(node_type.lower()) if node_type else None
+        if node_config is not None:
+            id_field_config = node_config.get("id_field", {})
+            return id_field_config.get("type", "string")
 
         # Fallback
         return "string"
 
     def _get_property_field_type(self, node_type: str, property_name: str) -> str:
         """Get the field type for a property from the schema config"""
-        nodes_config = self.schema_config.get("nodes", {})
-
-        # Look for the node type in config
-        for config_key, node_config in nodes_config.items():
-            if config_key.lower() == node_type.lower():
-                # Check ID field first
-                id_field_config = node_config.get("id_field", {})
-                if id_field_config.get("property_name") == property_name:
-                    return id_field_config.get("type", "string")
+        node_config = self._node_configs.get(node_type.lower())
+        if node_config is not None:
+            # Check ID field first
+            id_field_config = node_config.get("id_field", {})
+            if id_field_config.get("property_name") == property_name:
+                return id_field_config.get("type", "string")
 
-                # Check properties
-                properties_config = node_config.get("properties", {})
-                if property_name in properties_config:
-                    return properties_config[property_name].get("type", "string")
+            # Check properties
+            properties_config = node_config.get("properties", {})
+            if property_name in properties_config:
+                return properties_config[property_name].get("type", "string")
 
         # Fallback
         return "string"
@@ -418,40 +533,58 @@ MERGE (start)-[r:{rel_type}]->(end)
         # Fallback
         return "string"
 
-    def _convert_to_type(self, value, field_type: str):
-        """Convert value to the specified type"""
-        if pd.isna(value):
-            return None
+    @classmethod
+    def _cast_dataframe(
+        cls, df: pd.DataFrame, column_types: Dict[str, str]
+    ) -> pd.DataFrame:
+        """Cast each column to its configured type in one pass per column"""
+        df = df.copy()
+        for col, field_type in column_types.items():
+            df[col] = cls._cast_series(df[col], field_type)
+        return df
+
+    @classmethod
+    def _cast_series(cls, series: pd.Series, field_type: str) -> pd.Series:
+        """Convert a column to the specified type, keeping missing values missing"""
+        missing = series.isna()
 
         if field_type == "int":
-            return int(float(value))  # Handle cases where int is stored as float
+            # Truncate like int(float(value)) for ints stored as floats
+            return np.trunc(pd.to_numeric(series)).astype("Int64")
         elif field_type == "float":
-            return float(value)
+            return pd.to_numeric(series).astype("float64")
         elif field_type == "boolean":
-            if isinstance(value, str):
-                return value.lower() in ("true", "1", "yes", "on")
-            return bool(value)
+            # Cells are read as text; blank ones are gaps, not false
+            text = series.astype("string").str.strip().str.lower()
+            flags = text.isin(TRUE_VALUES).astype("boolean")
+            return flags.mask(missing | text.eq(""))
         elif field_type == "list":
-            # Parse JSON string back to Python list for Neo4j
-            if isinstance(value, str) and value.strip():
-                try:
-                    import json
-
-                    parsed_list = json.loads(value)
-                    return (
-                        parsed_list
-                        if isinstance(parsed_list, list)
-                        else [str(parsed_list)]
-                    )
-                except json.JSONDecodeError:
-                    # Fallback: return as single-item list
-                    return [str(value)]
-            elif isinstance(value, list):
-                return value  # Already a list
-            else:
-                return [str(value)]  # Convert to single-item list
+            # Parse JSON strings back to Python lists for Neo4j
+            return series.map(cls._parse_list, na_action="ignore")
         else:  # string or any other type
-            return str(value)
+            # One vectorised cast, then the missing mask restores NaNs
+            return series.astype(str).mask(missing)
+
+    @staticmethod
+    def _column_values(series: pd.Series) -> List[Any]:
+        """One column as a plain list for the driver, missing values as None"""
+        return series.astype(object).where(series.notna(), None).tolist()
+
+    @staticmethod
+    def _parse_list(value) -> List[Any]:
+        """Parse a JSON list cell, falling back to a single-item list"""
+        if isinstance(value, list):
+            return value  # Already a list
+        if isinstance(value, str) and value.strip():
+            try:
+                parsed_list = json.loads(value)
+                return (
+                    parsed_list if isinstance(parsed_list, list) else [str(parsed_list)]
+                )
+            except json.JSONDecodeError:
+                # Fallback: return as single-item list
+                return [str(value)]
+        return [str(value)]  # Convert to single-item list
 
     def execute_import(
         self, node_files: List[str], relationship_files: List[str]
@@ -474,107 +607,447 @@ MERGE (start)-[r:{rel_type}]->(end)
                 return results
 
         # Generate batch queries (UNWIND for high performance)
-        batch_size = 1000  # Standard batch size for all operations
+        batch_size = self.batch_size
 
-        # Import nodes first
+        # Import nodes first (batches are generated lazily as they are sent)
         self.logger.info("Starting node import...")
-        node_queries = self.generate_batch_queries(node_files, [], batch_size)
-        results["total_node_queries"] = len(node_queries)
+        results["total_node_queries"] = 0
+
+        # Running totals across all batches (queries_executed, nodes_created, ...)
+        totals = Counter()
 
         # Execute node import
+        executor = ThreadPoolExecutor(max_workers=self.import_workers)
+        # Relationship MERGEs sharing end nodes deadlock when run concurrently,
+        # so they get a single writer (parsing still overlaps the writes)
+        rel_executor = ThreadPoolExecutor(max_workers=1)
         try:
-            # Configure driver with longer timeouts for large imports
-            driver = GraphDatabase.driver(
-                self.uri,
-                auth=(self.username, self.password),
-                connection_timeout=30.0,  # 30 seconds connection timeout
-                max_connection_pool_size=50,  # Allow more connections
+            driver = self._get_driver()
+            index_targets = self._id_index_targets(node_files, relationship_files)
+            self._parallel_node_merge = self._create_id_indexes(driver, index_targets)
+            node_workers = self.import_workers if self._parallel_node_merge else 1
+            self._concurrent_tx_available = self._check_concurrent_transactions(
+                driver
+            )
+            self._apoc_available = self._check_apoc(driver)
+
+            # Every node batch completes before the first relationship batch is sent
+            results["total_node_queries"] = self._import_files(
+                driver,
+                executor,
+                node_workers,
+                node_files,
+                "nodes",
+                batch_size,
+                results,
+                totals,
             )
 
-            if node_queries:
-                self.logger.info(f"Importing nodes: {len(node_queries)} batches")
-                for i, (query, parameters) in enumerate(node_queries):
-                    self._execute_single_query(
-                        driver, i + 1, query, parameters, results, "nodes"
-                    )
-
+            if results["total_node_queries"]:
                 self.logger.info(
-                    f"✅ Node import completed: {results['nodes_created']} nodes created"
+                    f"✅ Node import completed: {results['total_node_queries']} "
+                    f"batches, {totals['nodes_created']} nodes created"
                 )
 
             # Import relationships
+            if relationship_files:
+                self._warm_id_indexes(driver, index_targets)
             self.logger.info("Starting relationship import...")
-            relationship_queries = self.generate_batch_queries(
-                [], relationship_files, batch_size
+            results["total_relationship_queries"] = self._import_files(
+                driver,
+                rel_executor,
+                1,
+                relationship_files,
+                "relationships",
+                batch_size,
+                results,
+                totals,
             )
-            results["total_relationship_queries"] = len(relationship_queries)
 
-            if relationship_queries:
+            if results["total_relationship_queries"]:
                 self.logger.info(
-                    f"Importing relationships: {len(relationship_queries)} batches"
+                    f"✅ Relationship import completed: "
+                    f"{results['total_relationship_queries']} batches, "
+                    f"{totals['relationships_created']} relationships created"
                 )
-                for i, (query, parameters) in enumerate(relationship_queries):
-                    self._execute_single_query(
-                        driver, i + 1, query, parameters, results, "relationships"
-                    )
 
-                self.logger.info(
-                    f"✅ Relationship import completed: {results['relationships_created']} relationships created"
-                )
-
-            driver.close()
             results["success"] = len(results["errors"]) == 0
 
-        except Exception as e:
+        except (ServiceUnavailable, AuthError) as e:
             results["errors"].append(f"Database connection failed: {str(e)}")
+        except Exception as e:
+            results["errors"].append(f"Import failed: {str(e)}")
+        finally:
+            executor.shutdown()
+            rel_executor.shutdown()
 
+        results.update(totals)
         return results
 
-    def _execute_single_query(
+    def _id_index_targets(
+        self, node_files: List[str], relationship_files: List[str]
+    ) -> List[Tuple[str, str]]:
+        """(node type, id property) pairs from schema_config and the CSV headers"""
+        targets = set()
+        # Headers cover labels the schema config leaves out (or no config at all)
+        for node_file in node_files:
+            if os.path.exists(node_file):
+                plan = self._parse_columns(pd.read_csv(node_file, nrows=0).columns)
+                if plan.id_prop:
+                    targets.add((self._node_label(node_file), plan.id_prop))
+        for rel_file in relationship_files:
+            if os.path.exists(rel_file):
+                plan = self._parse_columns(pd.read_csv(rel_file, nrows=0).columns)
+                for id_col in [plan.start_id_col, plan.end_id_col]:
+                    node_type = self._id_space(id_col)
+                    if node_type:
+                        targets.add((node_type, self._get_id_property_name(node_type)))
+        for node_type in self.schema_config.get("nodes", {}):
+            targets.add((node_type, self._get_id_property_name(node_type)))
+        for rel_config in self.schema_config.get("relationships", {}).values():
+            for key in ["start_node_type", "end_node_type"]:
+                node_type = rel_config.get(key)
+                if node_type:
+                    targets.add((node_type, self._get_id_property_name(node_type)))
+        return sorted(targets)
+
+    def _create_id_indexes(self, driver, targets: List[Tuple[str, str]]) -> bool:
+        """
+        Back each node type's id property with a uniqueness constraint (or, if
+        that can't be created, a plain index) so MERGE/MATCH avoid label scans.
+        Returns True only if every id is unique-constrained, which is what
+        makes parallel node MERGEs safe from creating duplicate nodes.
+        """
+        all_unique = True
+        try:
+            with driver.session(database=self.database) as session:
+                for label, id_property in targets:
+                    try:
+                        session.run(
+                            f"CREATE CONSTRAINT IF NOT EXISTS "
+                            f"FOR (n:{label}) REQUIRE n.{id_property} IS UNIQUE"
+                        ).consume()
+                    except Exception as e:
+                        # e.g. duplicate ids already stored, or a range index
+                        # on the same property left by an earlier import
+                        all_unique = False
+                        self.logger.warning(
+                            f"No uniqueness constraint on {label}.{id_property} "
+                            f"({e}); importing nodes serially"
+                        )
+                        session.run(
+                            f"CREATE INDEX IF NOT EXISTS "
+                            f"FOR (n:{label}) ON (n.{id_property})"
+                        ).consume()
+                # Relationship batches must not start before the indexes are online
+                session.run("CALL db.awaitIndexes()").consume()
+            self.logger.info(f"Ensured {len(targets)} node id indexes")
+        except Exception as e:
+            self.logger.warning(f"Could not create node id indexes: {e}")
+            return False
+        return all_unique
+
+    def _warm_id_indexes(self, driver, targets: List[Tuple[str, str]]) -> None:
+        """Scan each id index once so the first relationship MATCHes hit a warm cache"""
+        try:
+            with driver.session(database=self.database) as session:
+                # Indexes filled during the node import must be online first
+                session.run("CALL db.awaitIndexes()").consume()
+                for label, id_property in targets:
+                    # IS NOT NULL scans the id index (a bare count uses the count store)
+                    session.run(
+                        f"MATCH (n:{label}) WHERE n.{id_property} IS NOT NULL "
+                        f"RETURN count(n)"
+                    ).consume()
+        except Exception as e:
+            self.logger.warning(f"Could not warm node id indexes: {e}")
+
+    def _check_concurrent_transactions(self, driver) -> bool:
+        """Whether the server runs CALL (i) { } IN CONCURRENT TRANSACTIONS"""
+        try:
+            with driver.session(database=self.database) as session:
+                record = session.run(
+                    "CALL dbms.components() YIELD name, versions "
+                    "WHERE name = 'Neo4j Kernel' RETURN versions[0] AS version"
+                ).single()
+            # Versions look like "5.26.0", "5.27-aura" or "2025.01.0"
+            match = re.match(r"(\d+)\.(\d+)", record["version"] if record else "")
+            if match:
+                version = (int(match.group(1)), int(match.group(2)))
+                return version >= CONCURRENT_TRANSACTIONS_MIN_VERSION
+        except Exception as e:
+            self.logger.info(f"Could not read the Neo4j version: {e}")
+        return False
+
+    def _check_apoc(self, driver) -> bool:
+        """Whether apoc.periodic.iterate can be used; otherwise batch client-side"""
+        try:
+            with driver.session(database=self.database) as session:
+                session.run("RETURN apoc.version() AS version").consume()
+            return True
+        except Exception as e:
+            self.logger.info(f"APOC not available, batching client-side: {e}")
+            return False
+
+    def _import_files(
         self,
         driver,
-        query_index: int,
-        query: str,
-        parameters: dict,
+        executor: ThreadPoolExecutor,
+        workers: int,
+        csv_files: List[str],
+        import_type: str,
+        batch_size: int,
+        results: dict,
+        totals: Counter,
+    ) -> int:
+        """Send each file's batches through the worker pool and wait for them all."""
+        if import_type == "nodes":
+            generate_queries = self._generate_node_batch_queries
+        else:
+            generate_queries = self._generate_relationship_batch_queries
+
+        # Bound the batches in flight so files are still streamed, not buffered
+        max_pending = 2 * workers
+        pending = {}
+
+        def submit(batches):
+            future = executor.submit(self._execute_batches, driver, batches)
+            pending[future] = batches
+            if len(pending) >= max_pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    self._record_group_result(
+                        future, pending.pop(future), results, totals, import_type
+                    )
+
+        # Short batches (small files, file tails) share one transaction until
+        # together they fill a batch, saving a commit round trip each
+        group = []
+        group_rows = 0
+        batch_count = 0
+        for csv_file in csv_files:
+            if not os.path.exists(csv_file):
+                continue
+
+            for query, parameters in generate_queries(csv_file, batch_size):
+                batch_count += 1
+                batch = (batch_count, query, parameters)
+                # APOC-wrapped chunks have no top-level "rows"; they and
+                # IN TRANSACTIONS chunks (even a short tail) always go alone
+                rows = parameters.get("rows", batch_size)
+                if rows >= batch_size or IN_TRANSACTIONS_MARKER in query:
+                    submit([batch])
+                    continue
+
+                group.append(batch)
+                group_rows += rows
+                if group_rows >= batch_size:
+                    submit(group)
+                    group = []
+                    group_rows = 0
+
+        if group:
+            submit(group)
+
+        for future in wait(pending).done:
+            self._record_group_result(
+                future, pending[future], results, totals, import_type
+            )
+
+        return batch_count
+
+    def _execute_batches(
+        self, driver, batches: List[Tuple[int, str, dict]]
+    ) -> List[Dict[str, int]]:
+        """Run batches in one session and transaction (runs on a worker thread)."""
+        with driver.session(database=self.database) as session:
+            if len(batches) == 1:
+                _, query, parameters = batches[0]
+                # The server commits each inner transaction itself, so these run
+                # auto-commit: a managed retry would redo committed batches
+                if IN_TRANSACTIONS_MARKER in query:
+                    return [
+                        self._counter_dict(session.run(query, parameters).consume())
+                    ]
+                if query.startswith(APOC_ITERATE_PREFIX):
+                    return [self._run_apoc_batch(session, query, parameters)]
+            # Managed transaction: the driver retries transient failures
+            return session.execute_write(self._run_batches, batches)
+
+    @classmethod
+    def _run_batches(
+        cls, tx, batches: List[Tuple[int, str, dict]]
+    ) -> List[Dict[str, int]]:
+        return [
+            cls._run_batch(tx, query, parameters) for _, query, parameters in batches
+        ]
+
+    def _record_group_result(
+        self,
+        future,
+        batches: List[Tuple[int, str, dict]],
         results: dict,
+        totals: Counter,
         import_type: str,
     ):
-        """Execute a single query and update results."""
+        """Fold a finished transaction into results (called on the main thread only)."""
         try:
-            with driver.session(database=self.database) as session:
-                result = session.run(query, parameters)
-                summary = result.consume()
+            group_counters = future.result()
+        except Exception as e:
+            # The batches shared a transaction, so they all rolled back together
+            for query_index, _, _ in batches:
+                error_msg = f"{import_type} batch {query_index} failed: {str(e)}"
+                self.logger.error(error_msg)
+                results["errors"].append(error_msg)
+            return
+
+        for (query_index, _, parameters), counters in zip(batches, group_counters):
+            self._record_query_result(
+                query_index, parameters, counters, results, totals, import_type
+            )
 
-                batch_size = len(parameters.get("batch", []))
-                execution_info = {
+    def _record_query_result(
+        self,
+        query_index: int,
+        parameters: dict,
+        counters: Dict[str, int],
+        results: dict,
+        totals: Counter,
+        import_type: str,
+    ):
+        """Add one successful batch's counters to the running totals"""
+        totals["queries_executed"] += 1
+        totals.update(counters)
+
+        # APOC-wrapped batches carry the columnar rows under "params"
+        batch_size = parameters.get("params", parameters).get("rows", 0)
+        self.logger.debug(
+            "%s batch %d: %d rows, %d nodes, %d relationships created",
+            import_type,
+            query_index,
+            batch_size,
+            counters["nodes_created"],
+            counters["relationships_created"],
+        )
+        if self.keep_execution_summary:
+            results["execution_summary"].append(
+                {
                     "query_index": query_index,
                     "type": import_type,
-                    "nodes_created": summary.counters.nodes_created,
-                    "relationships_created": summary.counters.relationships_created,
-                    "properties_set": summary.counters.properties_set,
                     "batch_size": batch_size,
-                    "query": (query[:100] + "..." if len(query) > 100 else query),
+                    **counters,
                 }
-                results["execution_summary"].append(execution_info)
-                results["queries_executed"] = results.get("queries_executed", 0) + 1
-                results["nodes_created"] = (
-                    results.get("nodes_created", 0) + summary.counters.nodes_created
-                )
-                results["relationships_created"] = (
-                    results.get("relationships_created", 0)
-                    + summary.counters.relationships_created
+            )
+
+    @classmethod
+    def _run_batch(cls, tx, query: str, parameters: dict) -> Dict[str, int]:
+        return cls._counter_dict(tx.run(query, parameters).consume())
+
+    @staticmethod
+    def _counter_dict(summary) -> Dict[str, int]:
+        counters = summary.counters
+        return {
+            "nodes_created": counters.nodes_created,
+            "relationships_created": counters.relationships_created,
+            "properties_set": counters.properties_set,
+        }
+
+    @staticmethod
+    def _run_apoc_batch(session, query: str, parameters: dict) -> Dict[str, int]:
+        # Inner transactions commit on the server; their counts come back as data
+        record = session.run(query, parameters).single()
+        if record["failedBatches"]:
+            raise RuntimeError(
+                f"{record['failedBatches']} APOC batches failed: "
+                f"{record['errorMessages']}"
+            )
+        stats = record["updateStatistics"]
+        return {
+            "nodes_created": stats.get("nodesCreated", 0),
+            "relationships_created": stats.get("relationshipsCreated", 0),
+            "properties_set": stats.get("propertiesSet", 0),
+        }
+
+    def execute_admin_import(
+        self, node_files: List[str], relationship_files: List[str]
+    ) -> Dict[str, any]:
+        """
+        Full reload with the offline neo4j-admin database import.
+        Only for a stopped, self-managed database: the target database is
+        overwritten. AuraDB has no offline import, so use execute_import there
+        (or import locally and push the result with neo4j-admin database upload).
+        """
+        results = {"success": False, "errors": [], "database_cleared": False}
+
+        neo4j_admin = shutil.which("neo4j-admin")
+        if not neo4j_admin:
+            results["errors"].append("neo4j-admin not found on PATH")
+            return results
+
+        command = [neo4j_admin, "database", "import", "full"]
+        with tempfile.TemporaryDirectory(prefix="neo4j_admin_") as admin_dir:
+            try:
+                for node_file in filter(os.path.exists, node_files):
+                    path = self._write_admin_csv(node_file, admin_dir)
+                    command.append(f"--nodes={self._node_label(node_file)}={path}")
+                for rel_file in filter(os.path.exists, relationship_files):
+                    path = self._write_admin_csv(rel_file, admin_dir)
+                    command.append(f"--relationships={path}")
+            except Exception as e:
+                results["errors"].append(f"Failed to prepare import CSVs: {str(e)}")
+                return results
+
+            command += [
+                f"--array-delimiter={ADMIN_ARRAY_DELIMITER}",
+                "--multiline-fields=true",
+                "--overwrite-destination=true",
+                self.database,
+            ]
+            self.logger.info(f"Running offline import: {' '.join(command)}")
+            result = subprocess.run(command, capture_output=True, text=True)
+
+        if result.returncode != 0:
+            results["errors"].append(f"neo4j-admin import failed: {result.stderr}")
+            return results
+
+        results["success"] = True
+        results["database_cleared"] = True
+        return results
+
+    def _write_admin_csv(self, csv_file: str, admin_dir: str) -> str:
+        """Copy a CSV for neo4j-admin, cast per schema as execute_import casts it"""
+        plan = self._parse_columns(pd.read_csv(csv_file, nrows=0).columns)
+        if plan.start_id_col:
+            column_types = self._relationship_column_types(
+                self._relationship_config_key(csv_file), plan
+            )
+        else:
+            column_types = self._node_column_types(self._node_label(csv_file), plan)
+
+        columns = []
+        for col in pd.read_csv(csv_file, nrows=0).columns:
+            if col == plan.id_col:
+                # neo4j-admin stores :ID values as strings, so the id space
+                # column is unnamed and the id is stored by a typed copy
+                columns.append((col, f":ID({self._id_space(col)})"))
+                columns.append((col, admin_header(plan.id_prop, column_types[col])))
+            elif col.startswith(":"):
+                columns.append((col, col))
+            else:
+                columns.append(
+                    (col, admin_header(col.split(":")[0], column_types[col]))
                 )
 
-        except Exception as e:
-            error_msg = f"{import_type} batch {query_index} failed: {str(e)}"
-            self.logger.error(error_msg)
-            results["errors"].append(error_msg)
+        path = os.path.join(admin_dir, os.path.basename(csv_file))
+        with pd.read_csv(csv_file, chunksize=self.batch_size, dtype=str) as reader:
+            write_admin_csv(path, reader, columns, column_types)
+        return path
 
     def clear_database(self) -> Tuple[bool, str]:
         """Clear all nodes and relationships - USE WITH CAUTION!"""
         try:
-            driver = GraphDatabase.driver(self.uri, auth=(self.username, self.password))
-            with driver.session() as session:
+            driver = self._get_driver()
+            with driver.session(database=self.database) as session:
                 # Delete all relationships first
                 result = session.run("MATCH ()-[r]-() DELETE r")
                 rel_summary = result.consume()
@@ -587,7 +1060,6 @@ MERGE (start)-[r:{rel_type}]->(end)
                     f"Cleared database: {rel_summary.counters.relationships_deleted} "
                     f"relationships, {node_summary.counters.nodes_deleted} nodes deleted"
                 )
-                driver.close()
                 return True, message
 
         except Exception as e:
@@ -596,8 +1068,8 @@ MERGE (start)-[r:{rel_type}]->(end)
     def get_database_stats(self) -> Dict[str, any]:
         """Get current database statistics"""
         try:
-            driver = GraphDatabase.driver(self.uri, auth=(self.username, self.password))
-            with driver.session() as session:
+            driver = self._get_driver()
+            with driver.session(database=self.database) as session:
                 # Count nodes
                 node_result = session.run("MATCH (n) RETURN count(n) as node_count")
                 node_count = node_result.single()["node_count"]
@@ -616,7 +1088,6 @@ MERGE (start)-[r:{rel_type}]->(end)
                 types_result = session.run("CALL db.relationshipTypes()")
                 rel_types = [record["relationshipType"] for record in types_result]
 
-                driver.close()
                 return {
                     "nodes": node_count,
                     "relationships": rel_count,
@@ -627,3 +1098,42 @@ MERGE (start)-[r:{rel_type}]->(end)
 
         except Exception as e:
             return {"error": f"Failed to get database stats: {str(e)}"}
+
+
+def admin_header(prop_name: str, field_type: str) -> str:
+    """neo4j-admin header for a property of the given schema field type"""
+    return f"{prop_name}:{ADMIN_HEADER_TYPES.get(field_type, 'string')}"
+
+
+def write_admin_csv(
+    path: str,
+    chunks: Iterable[pd.DataFrame],
+    columns: List[Tuple[str, str]],
+    column_types: Dict[str, str],
+) -> None:
+    """
+    Write chunks as one neo4j-admin CSV. Each chunk is cast per column_types
+    as the online import casts it, then written as (source column, header)
+    pairs; a source column may back more than one header.
+    """
+    with open(path, "w", newline="", buffering=64 * 1024) as f:
+        writer = csv.writer(f)
+        writer.writerow([header for _, header in columns])
+        for chunk in chunks:
+            chunk = AuraDBLoader._cast_dataframe(chunk, column_types)
+            cells = {
+                col: list(map(_admin_cell, AuraDBLoader._column_values(chunk[col])))
+                for col, _ in columns
+            }
+            writer.writerows(zip(*(cells[col] for col, _ in columns)))
+
+
+def _admin_cell(value: Any) -> Optional[str]:
+    """A cast value in neo4j-admin syntax; None leaves the cell empty"""
+    if value is None:
+        return None
+    if isinstance(value, (bool, np.bool_)):
+        return "true" if value else "false"
+    if isinstance(value, list):
+        return ADMIN_ARRAY_DELIMITER.join(_admin_cell(item) or "" for item in value)
+    return str(value)
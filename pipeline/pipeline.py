@@ -1,3 +1,5 @@
+import sys
+import time
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Callable
 from dataclasses import dataclass
@@ -12,6 +14,9 @@ from pipeline.transformers import CSVTransformer, TransformerFactory
 from pipeline.loaders import Neo4jLoader
 from pipeline.auradb_loader import AuraDBLoader
 
+# Minimum seconds between progress lines within the same stage
+PROGRESS_PRINT_INTERVAL = 0.1
+
 
 class PipelineStage(Enum):
     LOADING_CONFIG = "loading_config"
@@ -69,6 +74,10 @@ class Pipeline:
         self.csv_files: Dict[str, List[str]] = {"nodes": [], "relationships": []}
         self.data_lineage = DataLineage()
 
+        # Throttle state for the default progress callback
+        self._last_progress_stage: Optional[PipelineStage] = None
+        self._last_progress_time = 0.0
+
         self._ensure_output_dir()
 
     def _ensure_output_dir(self) -> None:
@@ -77,12 +86,30 @@ class Pipeline:
 
     def _default_progress_callback(self, progress: PipelineProgress) -> None:
         """Default progress callback that prints to console."""
-        print(
+        # Always show stage changes and completion; throttle updates in between
+        now = time.monotonic()
+        stage_changed = progress.stage != self._last_progress_stage
+        if (
+            not stage_changed
+            and progress.progress_percent < 100
+            and now - self._last_progress_time < PROGRESS_PRINT_INTERVAL
+        ):
+            return
+
+        self._last_progress_stage = progress.stage
+        self._last_progress_time = now
+
+        line = (
             f"[{progress.stage.value}] {progress.progress_percent:.1f}% - "
-            f"{progress.message}"
+            f"{progress.message}\n"
         )
         if progress.total_records > 0:
-            print(f"  Records: {progress.records_processed}/{progress.total_records}")
+            line += (
+                f"  Records: {progress.records_processed}/{progress.total_records}\n"
+            )
+        sys.stdout.write(line)
+        if stage_changed:
+            sys.stdout.flush()
 
     def _report_progress(
         self,
@@ -67,7 +67,7 @@ class Neo4jImportValidator:
         """Validate complete CSV import process."""
         import time
 
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         validation_errors = []
         warnings = []
@@ -81,7 +81,7 @@ class Neo4jImportValidator:
                     relationships_imported=0,
                     validation_errors=["Failed to connect to Neo4j database"],
                     warnings=[],
-                    execution_time_seconds=time.time() - start_time,
+                    execution_time_seconds=time.perf_counter() - start_time,
                 )
 
             # Load configuration
@@ -110,7 +110,7 @@ class Neo4jImportValidator:
                     relationships_imported=0,
                     validation_errors=validation_errors,
                     warnings=warnings,
-                    execution_time_seconds=time.time() - start_time,
+                    execution_time_seconds=time.perf_counter() - start_time,
                 )
 
             self.logger.info(f"📁 Found {len(csv_files)} CSV files for import")
@@ -125,7 +125,7 @@ class Neo4jImportValidator:
                     relationships_imported=0,
                     validation_errors=validation_errors,
                     warnings=warnings,
-                    execution_time_seconds=time.time() - start_time,
+                    execution_time_seconds=time.perf_counter() - start_time,
                 )
 
             # Import data using AuraDB loader
@@ -140,7 +140,7 @@ class Neo4jImportValidator:
                     relationships_imported=0,
                     validation_errors=validation_errors,
                     warnings=warnings,
-                    execution_time_seconds=time.time() - start_time,
+                    execution_time_seconds=time.perf_counter() - start_time,
                 )
 
             # Validate imported data
@@ -162,7 +162,7 @@ class Neo4jImportValidator:
                 relationships_imported=relationship_count,
                 validation_errors=validation_errors,
                 warnings=warnings,
-                execution_time_seconds=time.time() - start_time,
+                execution_time_seconds=time.perf_counter() - start_time,
             )
 
         except Exception as e:
@@ -174,7 +174,7 @@ class Neo4jImportValidator:
                 relationships_imported=0,
                 validation_errors=validation_errors,
                 warnings=warnings,
-                execution_time_seconds=time.time() - start_time,
+                execution_time_seconds=time.perf_counter() - start_time,
             )
 
         finally:
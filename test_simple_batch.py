@@ -75,6 +75,61 @@ def test_config_manager():
     print("✅ ConfigManager test passed")
 
 
+def test_prune_materialized_views():
+    """Test MV fields are pruned to those used downstream."""
+    print("Testing MV field pruning...")
+
+    config = {
+        "materialized_views": {
+            "lessons_mv": [
+                "unit_slug",
+                'lesson_slug: lesson_data(path: "slug")',
+                'lesson_tags: lesson_data(path: "tags")',
+                "is_legacy",
+                "year_slug",
+            ],
+            "units_mv": ["unit_slug", "unit_order", "unit_notes"],
+        },
+        "join_strategy": {
+            "type": "multi_source_join",
+            "primary_mv": "lessons_mv",
+            "joins": [
+                {
+                    "mv": "units_mv",
+                    "on": {"left_key": "unit_slug", "right_key": "unit_slug"},
+                }
+            ],
+        },
+        "filters": {"is_legacy": False},
+        "schema_mapping": {
+            "nodes": {
+                "Lesson": {
+                    "id_field": {"hasura_col": "lesson_slug"},
+                    "properties": {"unitOrder": {"hasura_col": "unit_order"}},
+                },
+                "Offering": {
+                    "id_field": {"hasura_col": "", "synthetic_value": "{year_slug}"},
+                    "properties": {},
+                },
+            },
+            "relationships": {},
+        },
+    }
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        pruned = ConfigManager(temp_dir).prune_materialized_views(config)
+
+    assert pruned["lessons_mv"] == [
+        "unit_slug",
+        'lesson_slug: lesson_data(path: "slug")',
+        "is_legacy",
+        "year_slug",
+    ]
+    assert pruned["units_mv"] == ["unit_slug", "unit_order"]
+
+    print("✅ MV field pruning test passed")
+
+
 def test_data_cleaner():
     """Test data cleaner with sample CSV."""
     print("Testing DataCleaner...")
@@ -187,6 +242,7 @@ def main():
 
     try:
         test_config_manager()
+        test_prune_materialized_views()
         test_data_cleaner()
         test_schema_mapper()
         test_invalid_config()
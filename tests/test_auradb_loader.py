@@ -0,0 +1,426 @@
+import csv
+import os
+import pandas as pd
+import pytest
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, wait
+from unittest.mock import Mock, patch
+from neo4j.exceptions import ServiceUnavailable
+from pipeline import auradb_loader
+from pipeline.auradb_loader import AuraDBLoader
+
+SCHEMA_CONFIG = {
+    "nodes": {
+        "Lesson": {
+            "id_field": {"property_name": "lessonId", "type": "int"},
+            "properties": {
+                "title": {"type": "string"},
+                "count": {"type": "int"},
+                "score": {"type": "float"},
+                "active": {"type": "boolean"},
+                "tags": {"type": "list"},
+            },
+        },
+        "Unit": {"id_field": {"property_name": "unitSlug", "type": "string"}},
+    },
+    "relationships": {
+        "unit_lesson": {
+            "start_node_type": "Unit",
+            "end_node_type": "Lesson",
+            "properties": {"order": {"type": "int"}},
+        }
+    },
+}
+
+
+@pytest.fixture
+def loader():
+    env = {
+        "NEO4J_URI": "neo4j+s://test.databases.neo4j.io",
+        "NEO4J_USERNAME": "neo4j",
+        "NEO4J_PASSWORD": "password",
+    }
+    with patch.dict(os.environ, env), patch("pipeline.auradb_loader.load_dotenv"):
+        with patch("pipeline.auradb_loader.GraphDatabase"):
+            yield AuraDBLoader(schema_config=SCHEMA_CONFIG, batch_size=2)
+
+
+def write_csv(path, rows):
+    with open(path, "w", newline="") as f:
+        csv.writer(f).writerows(rows)
+    return str(path)
+
+
+def read_csv(path):
+    with open(path, newline="") as f:
+        return list(csv.reader(f))
+
+
+def text_series(values):
+    """A column as read from CSV: text, with gaps as missing values"""
+    return pd.Series(values, dtype=str)
+
+
+class TestCastSeries:
+    def test_int(self, loader):
+        series = text_series(["3", "2.0", "", None, "-1.7"])
+
+        cast = loader._cast_series(series, "int")
+
+        assert str(cast.dtype) == "Int64"
+        assert loader._column_values(cast) == [3, 2, None, None, -1]
+
+    def test_int_rejects_bad_values(self, loader):
+        with pytest.raises(ValueError):
+            loader._cast_series(text_series(["3", "three"]), "int")
+
+    def test_float(self, loader):
+        series = text_series(["1.5", "2", "", None])
+
+        cast = loader._cast_series(series, "float")
+
+        assert loader._column_values(cast) == [1.5, 2.0, None, None]
+
+    def test_float_rejects_bad_values(self, loader):
+        with pytest.raises(ValueError):
+            loader._cast_series(text_series(["1.5", "n/a"]), "float")
+
+    def test_boolean(self, loader):
+        series = text_series(["true", " Yes ", "1", "on", "false", "0", "", None])
+
+        cast = loader._cast_series(series, "boolean")
+
+        assert loader._column_values(cast) == [
+            True,
+            True,
+            True,
+            True,
+            False,
+            False,
+            None,
+            None,
+        ]
+
+    def test_boolean_treats_unknown_values_as_false(self, loader):
+        cast = loader._cast_series(text_series(["maybe", "2.0"]), "boolean")
+
+        assert loader._column_values(cast) == [False, False]
+
+    def test_list(self, loader):
+        series = text_series(['["a", "b"]', "[1, 2]", '"solo"', "not json", None])
+
+        cast = loader._cast_series(series, "list")
+
+        assert loader._column_values(cast) == [
+            ["a", "b"],
+            [1, 2],
+            ["solo"],
+            ["not json"],
+            None,
+        ]
+
+    def test_string_keeps_gaps(self, loader):
+        cast = loader._cast_series(text_series(["2.0", None]), "string")
+
+        assert loader._column_values(cast) == ["2.0", None]
+
+
+class TestAdminImportCsv:
+    def test_node_csv_is_cast_per_schema(self, loader, tmp_path):
+        source = write_csv(
+            tmp_path / "lesson_nodes.csv",
+            [
+                [
+                    "lessonId:ID(Lesson)",
+                    "title:string",
+                    "count:int",
+                    "score:float",
+                    "active:boolean",
+                    "tags:list",
+                ],
+                ["2.0", "Line one\nline two", "3.0", "1.5", "yes", '["a", "b"]'],
+                ["7", "Plain", "", "2", "FALSE", ""],
+                ["9", "", "4", "", "", "single"],
+            ],
+        )
+        admin_dir = tmp_path / "admin"
+        admin_dir.mkdir()
+
+        path = loader._write_admin_csv(source, str(admin_dir))
+
+        # Three rows over two chunks (batch_size=2) share one header
+        assert read_csv(path) == [
+            [
+                ":ID(Lesson)",
+                "lessonId:long",
+                "title:string",
+                "count:long",
+                "score:double",
+                "active:boolean",
+                "tags:string[]",
+            ],
+            ["2", "2", "Line one\nline two", "3", "1.5", "true", "a;b"],
+            ["7", "7", "Plain", "", "2.0", "false", ""],
+            ["9", "9", "", "4", "", "", "single"],
+        ]
+
+    def test_relationship_ids_match_node_ids(self, loader, tmp_path):
+        source = write_csv(
+            tmp_path / "unit_lesson_part1_relationships.csv",
+            [
+                [":START_ID(Unit)", ":END_ID(Lesson)", ":TYPE", "order:int"],
+                ["unit-a", "2.0", "HAS_LESSON", "1.0"],
+                ["unit-b", "7", "HAS_LESSON", ""],
+            ],
+        )
+
+        path = loader._write_admin_csv(source, str(tmp_path))
+
+        assert read_csv(path) == [
+            [":START_ID(Unit)", ":END_ID(Lesson)", ":TYPE", "order:long"],
+            ["unit-a", "2", "HAS_LESSON", "1"],
+            ["unit-b", "7", "HAS_LESSON", ""],
+        ]
+
+    def test_header_only_csv(self, loader, tmp_path):
+        source = write_csv(tmp_path / "unit_nodes.csv", [["unitSlug:ID(Unit)", "name"]])
+        admin_dir = tmp_path / "admin"
+        admin_dir.mkdir()
+
+        path = loader._write_admin_csv(source, str(admin_dir))
+
+        assert read_csv(path) == [[":ID(Unit)", "unitSlug:string", "name:string"]]
+
+
+class TestColumnarBatchQueries:
+    def test_node_batches(self, loader, tmp_path):
+        source = write_csv(
+            tmp_path / "lesson_nodes.csv",
+            [
+                ["lessonId:ID(Lesson)", "lesson title", "count:int"],
+                ["1", "Intro", "3"],
+                ["2.0", "", ""],
+                ["3", "Outro", "5.0"],
+            ],
+        )
+
+        batches = list(loader._generate_node_batch_queries(source, 2))
+
+        assert [query for query, _ in batches] == [
+            "UNWIND range(0, $rows - 1) AS i\n"
+            "MERGE (n:Lesson {lessonId: $ids[i]})\n"
+            "SET n.`lesson title` = "
+            "coalesce($props.`lesson title`[i], n.`lesson title`), "
+            "n.`count` = coalesce($props.`count`[i], n.`count`)"
+        ] * 2
+        assert [parameters for _, parameters in batches] == [
+            {
+                "rows": 2,
+                "ids": [1, 2],
+                "props": {"lesson title": ["Intro", None], "count": [3, None]},
+            },
+            {
+                "rows": 1,
+                "ids": [3],
+                "props": {"lesson title": ["Outro"], "count": [5]},
+            },
+        ]
+
+    def test_node_batches_without_id_create_nodes(self, loader, tmp_path):
+        source = write_csv(tmp_path / "tag_nodes.csv", [["name"], ["x"], [""]])
+
+        [(query, parameters)] = loader._generate_node_batch_queries(source, 2)
+
+        assert query == (
+            "UNWIND range(0, $rows - 1) AS i\n"
+            "CREATE (n:Tag)\n"
+            "SET n.`name` = $props.`name`[i]"
+        )
+        assert parameters == {"rows": 2, "props": {"name": ["x", None]}}
+
+    def test_relationship_batches(self, loader, tmp_path):
+        source = write_csv(
+            tmp_path / "unit_lesson_relationships.csv",
+            [
+                [":START_ID(Unit)", ":END_ID(Lesson)", ":TYPE", "order:int"],
+                ["unit-a", "2.0", "HAS_LESSON", "1"],
+                ["unit-b", "7", "HAS_LESSON", ""],
+            ],
+        )
+
+        [(query, parameters)] = loader._generate_relationship_batch_queries(source, 2)
+
+        assert query == (
+            "UNWIND range(0, $rows - 1) AS i\n"
+            "MATCH (start:Unit {unitSlug: $start_ids[i]}),\n"
+            "      (end:Lesson {lessonId: $end_ids[i]})\n"
+            "MERGE (start)-[r:HAS_LESSON]->(end)\n"
+            "SET r.`order` = coalesce($props.`order`[i], r.`order`)"
+        )
+        assert parameters == {
+            "rows": 2,
+            "start_ids": ["unit-a", "unit-b"],
+            "end_ids": [2, 7],
+            "props": {"order": [1, None]},
+        }
+
+
+def summary_for(rows):
+    """A result summary as the driver returns it, one node created per row"""
+    counters = Mock(nodes_created=rows, relationships_created=0, properties_set=0)
+    return Mock(counters=counters)
+
+
+def mock_driver():
+    """A driver whose queries report one node per row of their batch"""
+    session = Mock()
+    session.run.side_effect = lambda query, parameters: Mock(
+        consume=Mock(return_value=summary_for(parameters.get("rows", 0))),
+        single=Mock(
+            return_value={
+                "failedBatches": 0,
+                "errorMessages": {},
+                "updateStatistics": {
+                    "nodesCreated": parameters.get("params", {}).get("rows", 0)
+                },
+            }
+        ),
+    )
+
+    def execute_write(work, batches):
+        tx = Mock()
+        tx.run.side_effect = lambda query, parameters: Mock(
+            consume=Mock(return_value=summary_for(parameters["rows"]))
+        )
+        return work(tx, batches)
+
+    session.execute_write.side_effect = execute_write
+    driver = Mock()
+    driver.session.return_value.__enter__ = Mock(return_value=session)
+    driver.session.return_value.__exit__ = Mock(return_value=False)
+    return driver, session
+
+
+class TestImportFiles:
+    UNWIND = "UNWIND range(0, $rows - 1) AS i CREATE (n:Node)"
+    IN_TRANSACTIONS = (
+        "UNWIND range(0, $rows - 1) AS i\nCALL (i) {\nCREATE (n:Node)\n}"
+        " IN TRANSACTIONS OF 10 ROWS"
+    )
+    APOC = "CALL apoc.periodic.iterate($outer, $inner, {batchSize: $batch_size})"
+
+    def run_import(self, loader, tmp_path, batches_by_file, workers=2, driver=None):
+        """Run _import_files over stub files whose batches are given up front"""
+        files = []
+        for name in batches_by_file:
+            (tmp_path / name).write_text("")
+            files.append(str(tmp_path / name))
+
+        def generate(csv_file, batch_size):
+            return iter(batches_by_file[os.path.basename(csv_file)])
+
+        if driver is None:
+            driver, _ = mock_driver()
+        session = driver.session.return_value.__enter__()
+        results = {"errors": [], "execution_summary": []}
+        totals = Counter()
+        loader.keep_execution_summary = True
+        with patch.object(loader, "_generate_node_batch_queries", generate):
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                batch_count = loader._import_files(
+                    driver, executor, workers, files, "nodes", 10, results, totals
+                )
+        return batch_count, results, totals, session
+
+    def test_short_batches_share_transactions(self, loader, tmp_path):
+        batches_by_file = {
+            "a_nodes.csv": [(self.UNWIND, {"rows": 4})] * 3,
+            "b_nodes.csv": [(self.UNWIND, {"rows": 10}), (self.UNWIND, {"rows": 3})],
+            "c_nodes.csv": [
+                (self.IN_TRANSACTIONS, {"rows": 3}),
+                (self.APOC, {"batch_size": 10, "params": {"rows": 20}}),
+                (self.UNWIND, {"rows": 2}),
+            ],
+        }
+
+        batch_count, results, totals, session = self.run_import(
+            loader, tmp_path, batches_by_file
+        )
+
+        assert batch_count == 8
+        assert results["errors"] == []
+        # Short batches are grouped until they fill a batch, across files too;
+        # full batches go alone
+        grouped = sorted(
+            [index for index, _, _ in call.args[1]]
+            for call in session.execute_write.call_args_list
+        )
+        assert grouped == [[1, 2, 3], [4], [5, 8]]
+        # Server-batched queries run auto-commit, one per call
+        assert [call.args[0] for call in session.run.call_args_list] == [
+            self.IN_TRANSACTIONS,
+            self.APOC,
+        ]
+        # Every batch and every row is counted once
+        assert totals["queries_executed"] == 8
+        assert totals["nodes_created"] == 4 * 3 + 10 + 3 + 3 + 20 + 2
+        assert sorted(
+            (entry["query_index"], entry["batch_size"])
+            for entry in results["execution_summary"]
+        ) == [(1, 4), (2, 4), (3, 4), (4, 10), (5, 3), (6, 3), (7, 20), (8, 2)]
+
+    def test_pending_batches_are_bounded(self, loader, tmp_path):
+        batches_by_file = {"a_nodes.csv": [(self.UNWIND, {"rows": 10})] * 7}
+        waited = []
+
+        def recording_wait(futures, **kwargs):
+            waited.append(len(futures))
+            return wait(futures, **kwargs)
+
+        with patch.object(auradb_loader, "wait", side_effect=recording_wait):
+            batch_count, _, totals, _ = self.run_import(
+                loader, tmp_path, batches_by_file, workers=2
+            )
+
+        assert batch_count == 7
+        assert totals["nodes_created"] == 70
+        # Never more than 2 x workers batches submitted and not yet recorded
+        assert max(waited) == 4
+
+    def test_failed_group_reports_every_batch(self, loader, tmp_path):
+        batches_by_file = {"a_nodes.csv": [(self.UNWIND, {"rows": 4})] * 2}
+        driver, session = mock_driver()
+        session.execute_write.side_effect = RuntimeError("deadlock")
+
+        _, results, totals, _ = self.run_import(
+            loader, tmp_path, batches_by_file, driver=driver
+        )
+
+        # The grouped batches shared one transaction, so both failed
+        assert results["errors"] == [
+            "nodes batch 1 failed: deadlock",
+            "nodes batch 2 failed: deadlock",
+        ]
+        assert totals["queries_executed"] == 0
+
+
+class TestExecuteImport:
+    def test_connection_errors_are_reported_as_such(self, loader):
+        with patch.object(
+            loader, "_get_driver", side_effect=ServiceUnavailable("no route")
+        ):
+            results = loader.execute_import([], [])
+
+        assert results["success"] is False
+        assert results["errors"] == ["Database connection failed: no route"]
+
+    def test_other_errors_are_reported_as_import_failures(self, loader):
+        driver, _ = mock_driver()
+        with patch.object(loader, "_get_driver", return_value=driver):
+            with patch.object(
+                loader, "_id_index_targets", side_effect=ValueError("bad header")
+            ):
+                results = loader.execute_import([], [])
+
+        assert results["success"] is False
+        assert results["errors"] == ["Import failed: bad header"]
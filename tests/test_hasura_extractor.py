@@ -0,0 +1,164 @@
+import os
+import pandas as pd
+import pytest
+from unittest.mock import Mock, patch
+from hasura_extractor import HasuraExtractor
+
+
+@pytest.fixture
+def make_extractor(tmp_path):
+    def make(**kwargs):
+        env = {"HASURA_API_KEY": "test-key", "OAK_AUTH_TYPE": "oak-admin"}
+        with patch.dict(os.environ, env):
+            return HasuraExtractor(
+                endpoint="https://test-hasura.com/v1/graphql",
+                output_dir=str(tmp_path),
+                **kwargs,
+            )
+
+    return make
+
+
+def mock_pages(extractor, view_name, pages):
+    """Answer each POST with the next page of view rows"""
+    session = Mock()
+    session.post.side_effect = [
+        Mock(json=Mock(return_value={"data": {view_name: page}})) for page in pages
+    ]
+    extractor._local.session = session
+    return session
+
+
+def sent_queries(session):
+    return [call.kwargs["json"]["query"] for call in session.post.call_args_list]
+
+
+def rows(start, stop):
+    return [{"slug": f"lesson-{i}"} for i in range(start, stop)]
+
+
+class TestPaging:
+    def test_order_by_rendering(self, make_extractor):
+        extractor = make_extractor()
+
+        query = extractor._build_graphql_query(
+            "lessons_mv", ["slug", "title"], 50, 100, ["unit_slug", "slug"]
+        )
+
+        assert (
+            "lessons_mv(order_by: [{unit_slug: asc}, {slug: asc}], "
+            "limit: 50, offset: 100) {"
+        ) in query
+        assert "slug\n                title" in query
+
+    def test_first_page_has_no_offset(self, make_extractor):
+        extractor = make_extractor()
+
+        query = extractor._build_graphql_query("lessons_mv", ["slug"], 50, 0, None)
+
+        assert "lessons_mv(limit: 50) {" in query
+
+    def test_stops_after_partial_page(self, make_extractor):
+        extractor = make_extractor(page_size=2, page_order_by={"lessons_mv": ["slug"]})
+        session = mock_pages(extractor, "lessons_mv", [rows(0, 2), rows(2, 3)])
+
+        df = extractor._query_view_dataframe("lessons_mv", ["slug"])
+
+        assert df["slug"].tolist() == ["lesson-0", "lesson-1", "lesson-2"]
+        queries = sent_queries(session)
+        assert len(queries) == 2
+        assert "lessons_mv(order_by: [{slug: asc}], limit: 2) {" in queries[0]
+        assert "lessons_mv(order_by: [{slug: asc}], limit: 2, offset: 2) {" in (
+            queries[1]
+        )
+
+    def test_stops_after_empty_page(self, make_extractor):
+        extractor = make_extractor(page_size=2, page_order_by={"lessons_mv": ["slug"]})
+        session = mock_pages(extractor, "lessons_mv", [rows(0, 2), rows(2, 4), []])
+
+        df = extractor._query_view_dataframe("lessons_mv", ["slug"])
+
+        assert df["slug"].tolist() == [f"lesson-{i}" for i in range(4)]
+        assert len(sent_queries(session)) == 3
+        assert "offset: 4" in sent_queries(session)[2]
+
+    def test_empty_view(self, make_extractor):
+        extractor = make_extractor(page_size=2, page_order_by={"lessons_mv": ["slug"]})
+        mock_pages(extractor, "lessons_mv", [[]])
+
+        df = extractor._query_view_dataframe("lessons_mv", ["slug"])
+
+        assert df.empty
+
+    def test_limit_caps_the_last_page(self, make_extractor):
+        extractor = make_extractor(page_size=2, page_order_by={"lessons_mv": ["slug"]})
+        session = mock_pages(extractor, "lessons_mv", [rows(0, 2), rows(2, 3)])
+
+        df = extractor._query_view_dataframe("lessons_mv", ["slug"], limit=3)
+
+        assert len(df) == 3
+        queries = sent_queries(session)
+        # The limit is reached exactly, so no further page is requested
+        assert len(queries) == 2
+        assert "limit: 1, offset: 2" in queries[1]
+
+    def test_unpaged_without_order_by(self, make_extractor):
+        extractor = make_extractor(page_size=2)
+        session = mock_pages(extractor, "lessons_mv", [rows(0, 3)])
+
+        df = extractor._query_view_dataframe("lessons_mv", ["slug"], limit=10)
+
+        assert len(df) == 3
+        [query] = sent_queries(session)
+        assert "lessons_mv(limit: 10) {" in query
+
+
+class TestAlignJoinKeys:
+    def test_categorical_merge_matches_object_merge(self, make_extractor):
+        extractor = make_extractor()
+        left = pd.DataFrame(
+            {
+                "unit_slug": ["a", "b", "c", None, "a"],
+                "year": ["y1", "y1", "y2", "y1", "y2"],
+                "lesson": [1, 2, 3, 4, 5],
+            }
+        )
+        # Categories seen on only one side, and keys in a different order
+        right = pd.DataFrame(
+            {
+                "slug": ["c", "a", "d", "a", None],
+                "year": ["y2", "y1", "y1", "y2", "y1"],
+                "title": ["C", "A1", "D", "A2", "none"],
+            }
+        )
+        expected = left.merge(
+            right, left_on=["unit_slug", "year"], right_on=["slug", "year"], how="left"
+        )
+
+        aligned_left, aligned_right = extractor._align_join_keys(
+            left.copy(), right.copy(), ["unit_slug", "year"], ["slug", "year"]
+        )
+        result = aligned_left.merge(
+            aligned_right,
+            left_on=["unit_slug", "year"],
+            right_on=["slug", "year"],
+            how="left",
+        )
+
+        assert isinstance(aligned_left["unit_slug"].dtype, pd.CategoricalDtype)
+        assert aligned_left["unit_slug"].dtype == aligned_right["slug"].dtype
+        pd.testing.assert_frame_equal(
+            result.astype(object), expected.astype(object), check_dtype=False
+        )
+
+    def test_numeric_keys_are_left_alone(self, make_extractor):
+        extractor = make_extractor()
+        left = pd.DataFrame({"id": [1, 2]})
+        right = pd.DataFrame({"id": ["1", "2"]})
+
+        aligned_left, aligned_right = extractor._align_join_keys(
+            left, right, ["id"], ["id"]
+        )
+
+        assert aligned_left["id"].dtype == "int64"
+        assert not isinstance(aligned_right["id"].dtype, pd.CategoricalDtype)
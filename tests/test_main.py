@@ -0,0 +1,73 @@
+import os
+from main import EXPORT_CACHE_ENTRIES, get_export_cache_path, save_export_cache
+
+CONFIG = {
+    "hasura_endpoint": "https://test-hasura.com/v1/graphql",
+    "join_strategy": {"type": "single_source", "primary_mv": "lessons_mv"},
+    "test_limit": 10,
+}
+MATERIALIZED_VIEWS = {"lessons_mv": ["lesson_slug", "lesson_title"]}
+
+
+def export(tmp_path, name, content):
+    path = tmp_path / name
+    path.write_text(content)
+    return str(path)
+
+
+class TestExportCache:
+    def test_hit_for_the_same_config(self, tmp_path):
+        cache_path = get_export_cache_path(CONFIG, MATERIALIZED_VIEWS, tmp_path)
+        assert not cache_path.is_file()
+
+        save_export_cache(export(tmp_path, "export.csv", "a,b\n1,2\n"), cache_path)
+
+        # A later run with an equal (not identical) config finds the export
+        same_config = dict(reversed(list(CONFIG.items())))
+        hit = get_export_cache_path(same_config, dict(MATERIALIZED_VIEWS), tmp_path)
+        assert hit == cache_path
+        assert hit.read_text() == "a,b\n1,2\n"
+
+    def test_miss_after_the_config_changes(self, tmp_path):
+        cache_path = get_export_cache_path(CONFIG, MATERIALIZED_VIEWS, tmp_path)
+        save_export_cache(export(tmp_path, "export.csv", "a\n1\n"), cache_path)
+
+        changed_configs = [
+            ({**CONFIG, "test_limit": None}, MATERIALIZED_VIEWS),
+            (
+                {**CONFIG, "hasura_endpoint": "https://other/v1/graphql"},
+                MATERIALIZED_VIEWS,
+            ),
+            (CONFIG, {"lessons_mv": ["lesson_slug"]}),
+            (
+                {**CONFIG, "join_strategy": {"type": "multi_source_join"}},
+                MATERIALIZED_VIEWS,
+            ),
+        ]
+        for config, materialized_views in changed_configs:
+            miss = get_export_cache_path(config, materialized_views, tmp_path)
+            assert miss != cache_path
+            assert not miss.is_file()
+
+    def test_keeps_the_newest_entries(self, tmp_path):
+        cache_dir = get_export_cache_path(CONFIG, MATERIALIZED_VIEWS, tmp_path).parent
+        cache_dir.mkdir(parents=True)
+        old_entries = []
+        for age, name in enumerate(["extract-c.csv", "extract-b.csv", "extract-a.csv"]):
+            path = cache_dir / name
+            path.write_text(name)
+            # Older entries have older modification times
+            timestamp = 1_000_000 - age * 1000
+            os.utime(path, (timestamp, timestamp))
+            old_entries.append(path)
+        unrelated = cache_dir / "notes.txt"
+        unrelated.write_text("not an export")
+
+        cache_path = get_export_cache_path(CONFIG, MATERIALIZED_VIEWS, tmp_path)
+        save_export_cache(export(tmp_path, "export.csv", "new"), cache_path)
+
+        remaining = sorted(path.name for path in cache_dir.glob("extract-*.csv"))
+        assert len(remaining) == EXPORT_CACHE_ENTRIES == 3
+        assert remaining == sorted([cache_path.name, "extract-c.csv", "extract-b.csv"])
+        assert not old_entries[2].exists()
+        assert unrelated.exists()
@@ -0,0 +1,196 @@
+import csv
+import os
+import pytest
+from unittest.mock import Mock, patch
+from neo4j_loader import Neo4jLoader
+
+
+SCHEMA_CONFIG = {
+    "nodes": {
+        "Lesson": {
+            "id_field": {"property_name": "lessonId", "type": "int"},
+            "properties": {
+                "code": {"type": "string"},
+                "order": {"type": "int"},
+                "active": {"type": "boolean"},
+                "tags": {"type": "list"},
+            },
+        },
+        "Unit": {"id_field": {"property_name": "unitSlug", "type": "string"}},
+    },
+    "relationships": {
+        "unit_lesson": {
+            "relationship_type": "HAS_LESSON",
+            "start_node_type": "Unit",
+            "end_node_type": "Lesson",
+            "properties": {"weight": {"type": "float"}},
+        }
+    },
+}
+
+
+@pytest.fixture
+def loader():
+    env = {
+        "NEO4J_URI": "neo4j+s://test.databases.neo4j.io",
+        "NEO4J_USERNAME": "neo4j",
+        "NEO4J_PASSWORD": "password",
+    }
+    with patch.dict(os.environ, env), patch("neo4j_loader.GraphDatabase"):
+        yield Neo4jLoader(schema_config=SCHEMA_CONFIG)
+
+
+class TestOfflineBulkImport:
+    def run_import(self, loader, mapped_data):
+        """Run the offline import, capturing the command and the CSVs it wrote"""
+        captured = {}
+
+        def fake_run(command, **kwargs):
+            captured["command"] = command
+            for arg in command:
+                if arg.startswith(("--nodes=", "--relationships=")):
+                    path = arg.split("=")[-1]
+                    with open(path, newline="") as f:
+                        captured[os.path.basename(path)] = list(csv.reader(f))
+            return Mock(returncode=0, stderr="")
+
+        with patch("neo4j_loader.shutil.which", return_value="/bin/neo4j-admin"):
+            with patch("neo4j_loader.subprocess.run", side_effect=fake_run):
+                stats = loader._offline_bulk_import(mapped_data)
+        return stats, captured
+
+    def test_csvs_are_typed_from_schema_config(self, loader):
+        mapped_data = {
+            "nodes": {
+                "Lesson": [
+                    # First values would have guessed long, double and string
+                    {"id": 2.0, "code": 5, "order": None, "active": True},
+                    {"id": 7, "code": "x", "order": 3.0, "tags": ["a", "b"]},
+                ]
+            },
+            "relationships": {
+                "HAS_LESSON": [
+                    {
+                        "start_node_id": "unit-a",
+                        "end_node_id": 2.0,
+                        "start_label": "Unit",
+                        "end_label": "Lesson",
+                        "type": "HAS_LESSON",
+                        "weight": 1,
+                        "note": "multi\nline",
+                    }
+                ]
+            },
+        }
+
+        stats, captured = self.run_import(loader, mapped_data)
+
+        assert stats == {"nodes_created": 2, "relationships_created": 1}
+        assert captured["nodes_Lesson.csv"] == [
+            [
+                ":ID(Lesson)",
+                "id:long",
+                "code:string",
+                "order:long",
+                "active:boolean",
+                "tags:string[]",
+            ],
+            ["2", "2", "5", "", "true", ""],
+            ["7", "7", "x", "3", "", "a;b"],
+        ]
+        assert captured["rels_HAS_LESSON_Unit_Lesson.csv"] == [
+            [":START_ID(Unit)", ":END_ID(Lesson)", "weight:double", "note:string"],
+            ["unit-a", "2", "1.0", "multi\nline"],
+        ]
+
+    def test_command_allows_multiline_fields(self, loader):
+        mapped_data = {"nodes": {"Unit": [{"id": "unit-a", "title": "A"}]}}
+
+        _, captured = self.run_import(loader, mapped_data)
+
+        command = captured["command"]
+        assert command[1:4] == ["database", "import", "full"]
+        assert "--multiline-fields=true" in command
+        assert "--array-delimiter=;" in command
+        assert command[-1] == loader.database
+
+
+class TestRelationshipImport:
+    def test_apoc_batches_run_serially(self, loader):
+        session = loader._driver.session.return_value.__enter__.return_value
+        session.run.return_value.single.return_value = {
+            "failedOperations": 0,
+            "errorMessages": {},
+            "updateStatistics": {"relationshipsCreated": 2},
+        }
+        relationships = [{"s": 1, "e": 2, "p": {}}, {"s": 3, "e": 2, "p": {}}]
+
+        created = loader._write_relationships_with_apoc(
+            "HAS_LESSON", "start_node:Unit", "end_node:Lesson", relationships
+        )
+
+        assert created == 2
+        query = session.run.call_args.args[0]
+        assert "parallel: false" in query
+        assert "concurrency" not in query
+
+    def test_relationships_are_written_serially(self, loader):
+        session = loader._driver.session.return_value.__enter__.return_value
+        session.execute_write.side_effect = lambda work, query, batches: sum(
+            len(batch) for batch in batches
+        )
+        # Many start nodes sharing one end node: concurrent shards would deadlock
+        relationships = [
+            {
+                "start_node_id": f"unit-{i}",
+                "end_node_id": "lesson-1",
+                "start_label": "Unit",
+                "end_label": "Lesson",
+            }
+            for i in range(5, 0, -1)
+        ]
+
+        with patch.object(loader, "_has_periodic_iterate", return_value=False):
+            created = loader._import_relationships({"HAS_LESSON": relationships})
+
+        assert created == 5
+        # One session, whose transactions run one after another
+        loader._driver.session.assert_called_once()
+        written = [
+            rel
+            for call in session.execute_write.call_args_list
+            for batch in call.args[2]
+            for rel in batch
+        ]
+        assert [rel["s"] for rel in written] == [f"unit-{i}" for i in range(1, 6)]
+
+    def test_sort_key_orders_mixed_ids(self, loader):
+        relationships = [
+            {"s": "unit-b", "e": 2, "p": {}},
+            {"s": 10, "e": "lesson-a", "p": {}},
+            {"s": None, "e": 1, "p": {}},
+            {"s": 10, "e": 3, "p": {}},
+            {"s": "unit-a", "e": None, "p": {}},
+        ]
+
+        relationships.sort(key=loader._relationship_sort_key)
+
+        assert [(rel["s"], rel["e"]) for rel in relationships] == [
+            (10, 3),
+            (10, "lesson-a"),
+            ("unit-a", None),
+            ("unit-b", 2),
+            (None, 1),
+        ]
+
+    @pytest.mark.parametrize(
+        "start_node, end_node",
+        [("start_node:Unit", "end_node:Lesson"), ("start_node", "end_node")],
+    )
+    def test_query_always_sets_properties(self, loader, start_node, end_node):
+        query = loader._relationship_query("HAS_LESSON", start_node, end_node)
+
+        assert f"MATCH ({start_node} {{id: rel.s}})" in query
+        assert f"MATCH ({end_node} {{id: rel.e}})" in query
+        assert "CREATE (start_node)-[r:HAS_LESSON]->(end_node)" in query
+        assert query.rstrip().endswith("SET r = rel.p")
@@ -26,45 +26,47 @@ def clear_database_interactive() -> bool:
     print("=" * 40)
 
     try:
-        loader = AuraDBLoader()
-        print("✅ Connected to AuraDB")
-
-        # Get current stats
-        stats = loader.get_database_stats()
-        if "error" in stats:
-            print(f"❌ Error getting database stats: {stats['error']}")
-            return False
-
-        print(f"\nCurrent database contents:")
-        print(f"   Nodes: {stats['nodes']}")
-        print(f"   Relationships: {stats['relationships']}")
-        print(f"   Node labels: {stats['node_labels']}")
-        print(f"   Relationship types: {stats['relationship_types']}")
-
-        if stats["nodes"] == 0:
-            print("\n✅ Database is already empty!")
-            return True
-
-        # Confirm deletion
-        confirm = input(
-            f"\n⚠️  This will DELETE ALL {stats['nodes']} nodes and {stats['relationships']} relationships!\n   Continue? (type 'DELETE' to confirm): "
-        )
-
-        if confirm != "DELETE":
-            print("❌ Deletion cancelled")
-            return False
-
-        # Clear database
-        print("\n🗑️  Clearing database...")
-        success, message = loader.clear_database()
-
-        if success:
-            print(f"✅ {message}")
-            print("🎉 Database cleared successfully!")
-            return True
-        else:
-            print(f"❌ {message}")
-            return False
+        with AuraDBLoader() as loader:
+            print("✅ Connected to AuraDB")
+
+            # Get current stats
+            stats = loader.get_database_stats()
+            if "error" in stats:
+                print(f"❌ Error getting database stats: {stats['error']}")
+                return False
+
+            print(f"\nCurrent database contents:")
+            print(f"   Nodes: {stats['nodes']}")
+            print(f"   Relationships: {stats['relationships']}")
+            print(f"   Node labels: {stats['node_labels']}")
+            print(f"   Relationship types: {stats['relationship_types']}")
+
+            if stats["nodes"] == 0:
+                print("\n✅ Database is already empty!")
+                return True
+
+            # Confirm deletion
+            confirm = input(
+                f"\n⚠️  This will DELETE ALL {stats['nodes']} nodes and "
+                f"{stats['relationships']} relationships!\n"
+                "   Continue? (type 'DELETE' to confirm): "
+            )
+
+            if confirm != "DELETE":
+                print("❌ Deletion cancelled")
+                return False
+
+            # Clear database
+            print("\n🗑️  Clearing database...")
+            success, message = loader.clear_database()
+
+            if success:
+                print(f"✅ {message}")
+                print("🎉 Database cleared successfully!")
+                return True
+            else:
+                print(f"❌ {message}")
+                return False
 
     except Exception as e:
         print(f"❌ Error: {str(e)}")
@@ -79,8 +81,8 @@ def get_database_stats() -> Dict[str, Any]:
         dict: Database statistics including node count, relationships, labels, etc.
     """
     try:
-        loader = AuraDBLoader()
-        return loader.get_database_stats()
+        with AuraDBLoader() as loader:
+            return loader.get_database_stats()
     except Exception as e:
         return {"error": f"Failed to get database stats: {str(e)}"}
 
@@ -99,8 +101,8 @@ def clear_database_silent(confirm: bool = False) -> Tuple[bool, str]:
         return False, "Confirmation required: call with confirm=True"
 
     try:
-        loader = AuraDBLoader()
-        return loader.clear_database()
+        with AuraDBLoader() as loader:
+            return loader.clear_database()
     except Exception as e:
         return False, f"Failed to clear database: {str(e)}"
 
@@ -113,8 +115,8 @@ def test_database_connection() -> Tuple[bool, str]:
         tuple: (connected: bool, message: str)
     """
     try:
-        loader = AuraDBLoader()
-        return loader.test_connection()
+        with AuraDBLoader() as loader:
+            return loader.test_connection()
     except Exception as e:
         return False, f"Connection test failed: {str(e)}"
 
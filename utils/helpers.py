@@ -127,17 +127,11 @@ def validate_required_env_vars(required_vars: List[str]) -> Dict[str, str]:
         Dict of variable names to values
 
     Raises:
-        ValueError: If any required variables are missing
+        ValueError: If any required variables are missing or empty
     """
-    missing_vars = []
-    env_values = {}
-
-    for var_name in required_vars:
-        value = os.getenv(var_name)
-        if value is None:
-            missing_vars.append(var_name)
-        else:
-            env_values[var_name] = value
+    env_values = {var_name: os.environ.get(var_name) for var_name in required_vars}
+    # Unset and empty values both count as missing
+    missing_vars = [var_name for var_name, value in env_values.items() if not value]
 
     if missing_vars:
         raise ValueError(